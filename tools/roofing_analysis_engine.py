@@ -19,12 +19,16 @@ Features:
   - Batch address processing
 
 Requirements:
+  Python 3.9+ (3.10+ for slotted, lower-memory report objects)
   pip install requests Pillow pytesseract
 
 Optional (for OCR):
   brew install tesseract  # macOS
   sudo apt install tesseract-ocr  # Linux
 
+Optional (faster JSON output, falls back to stdlib json):
+  pip install orjson
+
 Usage:
   # Direct with API key:
   python roofing_analysis_engine.py --address "123 Main St, Edmonton, AB" --api-key AIzaSy...
@@ -46,21 +50,35 @@ Copyright (c) 2026 Reuse Canada. All rights reserved.
 """
 
 import argparse
+import atexit
+import hashlib
 import json
 import math
 import os
 import re
 import sys
+import tempfile
+import threading
 import time
-from dataclasses import dataclass, field, asdict
+from bisect import bisect_left
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import List, Optional, Dict, Tuple, Any
+from functools import lru_cache
+from html import escape
+from typing import TYPE_CHECKING, Iterator, List, Optional, Dict, Tuple, Any
+from urllib.parse import quote_plus
+
+# requests is imported when the first HTTP session is built (see _get_session),
+# so offline commands such as --compare start without loading it
+if TYPE_CHECKING:
+    import requests
 
 try:
-    import requests
+    import orjson  # Optional: faster JSON output
 except ImportError:
-    print("ERROR: 'requests' package required. Install with: pip install requests")
-    sys.exit(1)
+    orjson = None
 
 
 # ==============================================================================
@@ -72,12 +90,15 @@ SQFT_PER_SQM = 10.7639
 SQM_PER_SQFT = 0.0929
 
 # Waste factors for comparison table
-WASTE_FACTORS = [
+WASTE_FACTORS = (
     (5,  1.05, "Minimal waste (simple gable)"),
     (10, 1.10, "Standard waste (moderate complexity)"),
     (15, 1.15, "Above average (hips/valleys)"),
     (20, 1.20, "High waste (complex/cut-up roof)"),
-]
+)
+
+# Base waste percentage by complexity class (material estimate)
+WASTE_MAP = {"simple": 10, "moderate": 12, "complex": 14, "very_complex": 15}
 
 # Alberta material pricing (CAD, 2026 estimates)
 PRICING = {
@@ -95,19 +116,63 @@ PRICING = {
 
 # API key regex pattern (Google API key format)
 API_KEY_PATTERN = r'AIza[0-9A-Za-z\-_]{35}'
+# ASCII-only matching: the key alphabet is ASCII, so skip Unicode class tables.
+# No \b anchors: keys may end in '-' (no word boundary after it) and OCR
+# often glues the key to neighbouring text.
+API_KEY_RE = re.compile(API_KEY_PATTERN, re.ASCII)
+
+# Canadian postal code (A1A 1A1 / A1A1A1), matched in either case so the
+# address is not upper-cased just to search it
+POSTAL_CODE_RE = re.compile(r'[A-Za-z]\d[A-Za-z]\s?\d[A-Za-z]\d', re.ASCII)
+
+# Characters replaced with '_' when a batch address becomes a report file name
+SAFE_NAME_RE = re.compile(r'[^a-zA-Z0-9]')
+
+# 16-point compass rose, clockwise from North
+CARDINAL_DIRS = ('N', 'NNE', 'NE', 'ENE', 'E', 'ESE', 'SE', 'SSE',
+                 'S', 'SSW', 'SW', 'WSW', 'W', 'WNW', 'NW', 'NNW')
 
 # Google Solar API endpoint
 SOLAR_API_URL = "https://solar.googleapis.com/v1/buildingInsights:findClosest"
+SOLAR_REQUIRED_QUALITY = "HIGH"  # 0.1 m/pixel imagery
 
 # Google Geocoding API endpoint
 GEOCODING_API_URL = "https://maps.googleapis.com/maps/api/geocode/json"
 
+# Report imagery (rendered client-side via <img>): top-down satellite tile and
+# Street View from each compass heading
+STATIC_MAP_URL_TEMPLATE = ("https://maps.googleapis.com/maps/api/staticmap"
+                           "?center={lat},{lng}&zoom=20&size=600x400&maptype=satellite&key={key}")
+STREET_VIEW_URL_TEMPLATE = ("https://maps.googleapis.com/maps/api/streetview"
+                            "?size=600x400&location={lat},{lng}&heading={heading}&pitch=25&fov=90&key={key}")
+
+# Local cache of Geocoding/Solar responses (re-runs skip paid API calls)
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".reuse_canada", "api_cache")
+CACHE_TTL_SECONDS = 30 * 86400
+
+# Write buffer for saved reports: large enough that a whole HTML/JSON report
+# reaches the OS in one write instead of many 8 KiB chunks
+OUTPUT_BUFFER_SIZE = 1 << 20
+
 
 # ==============================================================================
 # DATA CLASSES
 # ==============================================================================
+# Slotted (Python 3.10+) to keep per-instance memory down when batch runs hold
+# many reports; older interpreters get regular dataclasses. Manual __slots__
+# is not an option for the fallback since slots conflict with field defaults.
+# to_dict() builds plain dicts directly instead of dataclasses.asdict(), which
+# recurses through copy.deepcopy for every nested value.
+
+_DATACLASS_OPTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def _shallow_dict(obj) -> Dict[str, Any]:
+    """Field name -> value for a report dataclass (values are not copied)."""
+    return {name: getattr(obj, name) for name in obj.__dataclass_fields__}
+
 
-@dataclass
+@dataclass(**_DATACLASS_OPTS)
 class RoofSegment:
     """A single roof plane/face with 3D measurements."""
     name: str
@@ -119,9 +184,10 @@ class RoofSegment:
     azimuth_degrees: float
     azimuth_direction: str    # Cardinal direction (N, NE, S, etc.)
     plane_height_meters: Optional[float] = None
+    area_multiplier: float = 1.0  # true_area / footprint, i.e. 1 / cos(pitch)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTS)
 class EdgeMeasurement:
     """A 3D linear measurement of a roof edge."""
     edge_type: str            # ridge, hip, valley, eave, rake
@@ -132,7 +198,7 @@ class EdgeMeasurement:
     adjacent_segments: Optional[List[int]] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTS)
 class MaterialLineItem:
     """A single line item on the Bill of Materials."""
     category: str
@@ -147,7 +213,7 @@ class MaterialLineItem:
     line_total_cad: float = 0.0
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTS)
 class MaterialEstimate:
     """Complete Bill of Materials for a roofing job."""
     net_area_sqft: float
@@ -161,8 +227,13 @@ class MaterialEstimate:
     complexity_class: str = "simple"
     shingle_type: str = "architectural"
 
+    def to_dict(self) -> Dict[str, Any]:
+        d = _shallow_dict(self)
+        d["line_items"] = [_shallow_dict(item) for item in self.line_items]
+        return d
 
-@dataclass
+
+@dataclass(**_DATACLASS_OPTS)
 class RASSegmentYield:
     """RAS material recovery analysis for a single segment."""
     segment_name: str
@@ -175,7 +246,7 @@ class RASSegmentYield:
     fiber_lbs: float = 0.0
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTS)
 class RASYieldAnalysis:
     """Complete RAS yield analysis for the entire roof."""
     total_area_sqft: float
@@ -194,8 +265,13 @@ class RASYieldAnalysis:
     processing_recommendation: str = ""
     slope_distribution: Dict[str, float] = field(default_factory=dict)
 
+    def to_dict(self) -> Dict[str, Any]:
+        d = _shallow_dict(self)
+        d["segments"] = [_shallow_dict(s) for s in self.segments]
+        return d
+
 
-@dataclass
+@dataclass(**_DATACLASS_OPTS)
 class EdgeSummary:
     """Aggregated edge totals."""
     total_ridge_ft: float = 0.0
@@ -204,9 +280,12 @@ class EdgeSummary:
     total_eave_ft: float = 0.0
     total_rake_ft: float = 0.0
     total_linear_ft: float = 0.0
+    # Edge counts used by complexity classification
+    hip_count: int = 0
+    valley_count: int = 0
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTS)
 class RoofReport:
     """Complete Pro-Grade Roof Measurement Report."""
     # Identification
@@ -273,17 +352,43 @@ class RoofReport:
     east_url: str = ""
     west_url: str = ""
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-dict view of the report for JSON output (shares lists/dicts with the report)."""
+        d = _shallow_dict(self)
+        d["segments"] = [_shallow_dict(s) for s in self.segments]
+        d["edges"] = [_shallow_dict(e) for e in self.edges]
+        d["edge_summary"] = _shallow_dict(self.edge_summary) if self.edge_summary else None
+        d["materials"] = self.materials.to_dict() if self.materials else None
+        d["ras_yield"] = self.ras_yield.to_dict() if self.ras_yield else None
+        return d
+
 
 # ==============================================================================
 # GEOMETRY HELPERS
 # ==============================================================================
 
+_SQRT2 = 1.4142135623730951          # math.sqrt(2)
+_SQRT2_TIMES_12 = 12 * _SQRT2
+_INV_SQRT1_5 = 0.8164965809277261     # 1 / math.sqrt(1.5), for the 1.5:1 footprint split
+
+
 def degrees_to_cardinal(deg: float) -> str:
-    """Convert compass degrees to 16-point cardinal direction."""
-    dirs = ['N', 'NNE', 'NE', 'ENE', 'E', 'ESE', 'SE', 'SSE',
-            'S', 'SSW', 'SW', 'WSW', 'W', 'WNW', 'NW', 'NNW']
-    index = round(((deg % 360) + 360) % 360 / 22.5) % 16
-    return dirs[index]
+    """
+    Convert compass degrees to 16-point cardinal direction.
+    Each sector is 22.5 deg wide and centred on its heading, so shifting
+    by half a sector (11.25) turns the lookup into a floor division.
+    """
+    return CARDINAL_DIRS[int((deg + 11.25) % 360 / 22.5) & 15]
+
+
+def _format_pitch_ratio(degrees: float) -> str:
+    rise = 12 * math.tan(math.radians(degrees))
+    return f"{round(rise * 10) / 10}:12"
+
+
+# X:12 strings for every pitch in 0.1 deg steps (index = round(degrees * 10)).
+# Index 900 (vertical) reports "0:12" like any other out-of-range pitch.
+_PITCH_RATIO_TABLE = tuple(_format_pitch_ratio(i / 10) for i in range(900)) + ("0:12",)
 
 
 def pitch_to_ratio(degrees: float) -> str:
@@ -291,11 +396,26 @@ def pitch_to_ratio(degrees: float) -> str:
     Convert pitch degrees to contractor X:12 format.
     Formula: rise = 12 * tan(pitch_degrees * PI / 180)
     Then round to nearest 0.1 for display: e.g. "6.7:12"
+
+    The pitch is taken to the nearest 0.1 deg (the precision reports show
+    it at) and looked up in a precomputed table.
     """
     if degrees <= 0 or degrees >= 90:
         return "0:12"
-    rise = 12 * math.tan(math.radians(degrees))
-    return f"{round(rise * 10) / 10}:12"
+    return _PITCH_RATIO_TABLE[round(degrees * 10)]
+
+
+def _pitch_area_multiplier(pitch_degrees: float) -> float:
+    """
+    Slope factor 1 / cos(pitch) that scales a footprint to true surface area.
+    Flat, vertical or out-of-range pitches return 1.0 (footprint unchanged).
+    """
+    if pitch_degrees <= 0 or pitch_degrees >= 90:
+        return 1.0
+    cos_angle = math.cos(math.radians(pitch_degrees))
+    if cos_angle <= 0:
+        return 1.0
+    return 1.0 / cos_angle
 
 
 def true_area_from_footprint(footprint_sqft: float, pitch_degrees: float) -> float:
@@ -306,14 +426,10 @@ def true_area_from_footprint(footprint_sqft: float, pitch_degrees: float) -> flo
     This accounts for the fact that a pitched roof has more surface area
     than its horizontal projection (the footprint you see from above).
     """
-    if pitch_degrees <= 0 or pitch_degrees >= 90:
-        return footprint_sqft
-    cos_angle = math.cos(math.radians(pitch_degrees))
-    if cos_angle <= 0:
-        return footprint_sqft
-    return footprint_sqft / cos_angle
+    return footprint_sqft * _pitch_area_multiplier(pitch_degrees)
 
 
+@lru_cache(maxsize=512)
 def hip_valley_factor(pitch_degrees: float) -> float:
     """
     3D length factor for hip/valley edges.
@@ -323,11 +439,14 @@ def hip_valley_factor(pitch_degrees: float) -> float:
 
     Factor = sqrt(2 * rise^2 + 288) / (12 * sqrt(2))
     where rise = 12 * tan(pitch)
+
+    Memoized: batch runs see the same handful of residential pitches.
     """
     rise = 12 * math.tan(math.radians(pitch_degrees))
-    return math.sqrt(2 * rise * rise + 288) / (12 * math.sqrt(2))
+    return math.sqrt(2 * rise * rise + 288) / _SQRT2_TIMES_12
 
 
+@lru_cache(maxsize=512)
 def rake_factor(pitch_degrees: float) -> float:
     """
     3D length factor for rake/common rafter edges.
@@ -338,10 +457,32 @@ def rake_factor(pitch_degrees: float) -> float:
     return 1.0 / math.cos(math.radians(pitch_degrees))
 
 
+@lru_cache(maxsize=512)
+def _pitch_rise_12(pitch_degrees: float) -> float:
+    """Rise per 12 units of run (segment pitches arrive rounded to 0.1 deg)."""
+    return 12 * math.tan(math.radians(pitch_degrees))
+
+
 # ==============================================================================
 # COMPLEXITY CLASSIFICATION
 # ==============================================================================
 
+# Inclusive upper bounds of each scoring band, looked up with bisect_left
+_SEGMENT_SCORE_BREAKS = (2, 4, 6)
+_PITCH_VARIATION_BREAKS = (5, 10)
+_COMPLEXITY_SCORE_BREAKS = (2, 5, 8)
+_COMPLEXITY_CLASSES = (
+    (1.0, "simple"),
+    (1.05, "moderate"),
+    (1.10, "complex"),
+    (1.15, "very_complex"),
+)
+# Class for every reachable score (0..15): score bands <=2, <=5, <=8, above
+_COMPLEXITY_BY_SCORE = tuple(
+    _COMPLEXITY_CLASSES[bisect_left(_COMPLEXITY_SCORE_BREAKS, score)]
+    for score in range(3 + 4 + 6 + 2 + 1)
+)
+
 def classify_complexity(
     segment_count: int,
     hip_count: int,
@@ -357,36 +498,18 @@ def classify_complexity(
     - complex:      factor 1.10, waste 14%
     - very_complex: factor 1.15, waste 15%
     """
-    score = 0
-
-    # Segment count: more faces = more complex
-    if segment_count <= 2:
-        score += 0
-    elif segment_count <= 4:
-        score += 1
-    elif segment_count <= 6:
-        score += 2
-    else:
-        score += 3
+    # Segment count: more faces = more complex (<=2: 0, <=4: 1, <=6: 2, else 3)
+    score = bisect_left(_SEGMENT_SCORE_BREAKS, segment_count)
 
     # Hip/valley edges
     score += min(hip_count, 4)
     score += min(valley_count * 2, 6)  # valleys are trickier
 
-    # Pitch variation
-    if pitch_variation > 10:
-        score += 2
-    elif pitch_variation > 5:
-        score += 1
-
-    if score <= 2:
-        return (1.0, "simple")
-    elif score <= 5:
-        return (1.05, "moderate")
-    elif score <= 8:
-        return (1.10, "complex")
-    else:
-        return (1.15, "very_complex")
+    # Pitch variation (>5 deg: +1, >10 deg: +2)
+    score += bisect_left(_PITCH_VARIATION_BREAKS, pitch_variation)
+
+    # Score bands <=2, <=5, <=8, above -> simple .. very_complex
+    return _COMPLEXITY_BY_SCORE[score]
 
 
 # ==============================================================================
@@ -414,13 +537,18 @@ def extract_api_key_from_image(image_path: str) -> Optional[str]:
         print(f"ERROR: Image file not found: {image_path}")
         return None
 
+    # Tesseract's OpenMP threading costs more than it saves on single screenshots
+    os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
     try:
-        image = Image.open(image_path)
+        # Grayscale input skips Tesseract's colour conversion; its own per-image
+        # (Otsu) binarization still runs, so light-on-dark text survives
+        image = Image.open(image_path).convert("L")
         text = pytesseract.image_to_string(image)
-        matches = re.findall(API_KEY_PATTERN, text)
+        match = API_KEY_RE.search(text)
 
-        if matches:
-            api_key = matches[0]
+        if match:
+            api_key = match.group()
             print(f"[OCR] Extracted API key: {api_key[:10]}...{api_key[-4:]}")
             return api_key
         else:
@@ -433,31 +561,186 @@ def extract_api_key_from_image(image_path: str) -> Optional[str]:
 
 def extract_api_key_from_text(text: str) -> Optional[str]:
     """Extract Google API key from plain text (config files, env vars, etc.)."""
-    matches = re.findall(API_KEY_PATTERN, text)
-    if matches:
-        return matches[0]
-    return None
+    match = API_KEY_RE.search(text)
+    return match.group() if match else None
+
+
+# ==============================================================================
+# HTTP SESSION (shared keep-alive pool for Solar + Geocoding)
+# ==============================================================================
+
+def _build_session() -> 'requests.Session':
+    """
+    Build a pooled HTTP session so batch runs reuse TCP/TLS connections
+    to the Google endpoints instead of handshaking on every request.
+
+    Transient failures (429/5xx) are retried with backoff. The final
+    response is returned rather than raised so callers keep their own
+    status-code handling.
+    """
+    try:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+    except ImportError:
+        print("ERROR: 'requests' package required. Install with: pip install requests")
+        sys.exit(1)
+
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False,
+    )
+    session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry))
+    return session
+
+
+_SESSION: Optional['requests.Session'] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _get_session() -> 'requests.Session':
+    """The shared pooled session, built on first use (safe across batch threads)."""
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                _SESSION = _build_session()
+    return _SESSION
+
+
+def close_session():
+    """Close all pooled connections (registered to run at interpreter exit)."""
+    if _SESSION is not None:
+        _SESSION.close()
+
+
+atexit.register(close_session)
+
+
+def _response_json(resp: 'requests.Response') -> Any:
+    """Decode a JSON response body (orjson when installed, else requests' decoder)."""
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return resp.json()
+
+
+# ==============================================================================
+# API RESPONSE CACHE (disk)
+# ==============================================================================
+
+class ResponseCache:
+    """
+    Minimal JSON-file cache for API responses, one file per key.
+
+    Repeat runs on the same property (re-processing, retried batches) are
+    served from disk instead of hitting the paid Google APIs again. Entries
+    expire after `ttl_seconds` (file mtime). Writes go through a temp file
+    + os.replace so concurrent batch workers never see partial files.
+    API keys are never part of the cache key or the stored data.
+    """
+
+    def __init__(self, directory: str, ttl_seconds: float, enabled: bool = True):
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+
+    def _path(self, key: Tuple) -> str:
+        digest = hashlib.sha256(json.dumps(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.json")
+
+    def get(self, key: Tuple) -> Any:
+        """Return the cached value for `key`, or None on miss/expiry/corruption."""
+        if not self.enabled:
+            return None
+        path = self._path(key)
+        try:
+            if time.time() - os.path.getmtime(path) > self.ttl_seconds:
+                return None
+            with open(path, "rb") as f:
+                data = f.read()
+            # Solar payloads run to megabytes: decode with orjson when installed
+            return orjson.loads(data) if orjson is not None else json.loads(data)
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key: Tuple, value: Any):
+        """Store `value` (JSON-serializable) under `key`; failures are non-fatal."""
+        if not self.enabled:
+            return
+        try:
+            payload = orjson.dumps(value) if orjson is not None else json.dumps(value).encode("utf-8")
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        except (OSError, TypeError, ValueError) as e:
+            print(f"[Cache] Could not write cache entry: {e}")
+            return
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, self._path(key))
+        except OSError as e:
+            # Never leave a stray *.tmp behind in the cache directory
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            print(f"[Cache] Could not write cache entry: {e}")
+
+
+_API_CACHE = ResponseCache(CACHE_DIR, CACHE_TTL_SECONDS)
+
+# In-process memo of successful geocodes, in front of the disk cache
+# (normalized address -> (lat, lng)); simply reset when it reaches the cap
+_GEOCODE_MEMO: Dict[str, Tuple[float, float]] = {}
+_GEOCODE_MEMO_MAX = 4096
 
 
 # ==============================================================================
 # GEOCODING (Address -> Lat/Lng)
 # ==============================================================================
 
-def geocode_address(address: str, api_key: str) -> Optional[Tuple[float, float]]:
+def _remember_geocode(normalized: str, coords: Tuple[float, float]) -> Tuple[float, float]:
+    """Add a geocode result to the in-process memo and return it."""
+    if _API_CACHE.enabled:
+        if len(_GEOCODE_MEMO) >= _GEOCODE_MEMO_MAX:
+            _GEOCODE_MEMO.clear()
+        _GEOCODE_MEMO[normalized] = coords
+    return coords
+
+
+def geocode_address(address: str, api_key: str,
+                    session: Optional['requests.Session'] = None) -> Optional[Tuple[float, float]]:
     """
     Convert street address to lat/lng using Google Geocoding API.
     Returns: (latitude, longitude) or None
+
+    Successful lookups are cached in memory and on disk (see ResponseCache),
+    keyed on the address with case and whitespace normalized. Requests go
+    through `session` (default: the shared module pool).
     """
+    normalized = " ".join(address.split()).upper()
+    if _API_CACHE.enabled:
+        coords = _GEOCODE_MEMO.get(normalized)
+        if coords is not None:
+            return coords
+
+    cache_key = ("geocode", normalized)
+    cached = _API_CACHE.get(cache_key)
+    if cached is not None:
+        return _remember_geocode(normalized, (cached[0], cached[1]))
+
     try:
-        resp = requests.get(GEOCODING_API_URL, params={
-            "address": address,
-            "key": api_key
-        }, timeout=10)
-        data = resp.json()
+        url = f"{GEOCODING_API_URL}?address={quote_plus(address)}&key={quote_plus(api_key)}"
+        resp = (session or _get_session()).get(url, timeout=10)
+        data = _response_json(resp)
 
         if data.get("status") == "OK" and data.get("results"):
             loc = data["results"][0]["geometry"]["location"]
-            return (loc["lat"], loc["lng"])
+            _API_CACHE.set(cache_key, [loc["lat"], loc["lng"]])
+            return _remember_geocode(normalized, (loc["lat"], loc["lng"]))
         else:
             print(f"[Geocode] Failed for '{address}': {data.get('status', 'unknown')}")
             return None
@@ -470,7 +753,8 @@ def geocode_address(address: str, api_key: str) -> Optional[Tuple[float, float]]
 # GOOGLE SOLAR API INTEGRATION
 # ==============================================================================
 
-def call_solar_api(lat: float, lng: float, api_key: str) -> Dict[str, Any]:
+def call_solar_api(lat: float, lng: float, api_key: str,
+                   session: Optional['requests.Session'] = None) -> Dict[str, Any]:
     """
     Call Google Solar API buildingInsights:findClosest endpoint.
 
@@ -482,23 +766,34 @@ def call_solar_api(lat: float, lng: float, api_key: str) -> Dict[str, Any]:
 
     Cost: ~$0.075 CAD per query
     Accuracy: 98.77% (validated against EagleView/Hover benchmarks)
+
+    Successful responses are cached on disk per location (6 decimal places,
+    ~0.1 m) and quality; a cache hit reports its own (tiny) duration.
+    Requests go through `session` (default: the shared module pool).
     """
-    params = {
-        "location.latitude": lat,
-        "location.longitude": lng,
-        "requiredQuality": "HIGH",
-        "key": api_key
-    }
+    cache_key = ("solar", round(lat, 6), round(lng, 6), SOLAR_REQUIRED_QUALITY)
 
     start = time.time()
-    resp = requests.get(SOLAR_API_URL, params=params, timeout=30)
+    data = _API_CACHE.get(cache_key)
+    if data is not None:
+        data["_api_duration_ms"] = (time.time() - start) * 1000
+        return data
+
+    # Query string built directly: coordinates and quality are plain ASCII,
+    # so only the key needs quoting (skips the params dict -> urlencode pass)
+    url = (f"{SOLAR_API_URL}?location.latitude={lat:.7f}&location.longitude={lng:.7f}"
+           f"&requiredQuality={SOLAR_REQUIRED_QUALITY}&key={quote_plus(api_key)}")
+    resp = (session or _get_session()).get(url, timeout=30)
     duration_ms = (time.time() - start) * 1000
 
     if resp.status_code != 200:
         err_text = resp.text[:300]
         raise RuntimeError(f"Google Solar API error {resp.status_code}: {err_text}")
 
-    data = resp.json()
+    # buildingInsights payloads carry large solarPanels/financialAnalyses
+    # arrays we never read, so the decoder speed matters here
+    data = _response_json(resp)
+    _API_CACHE.set(cache_key, data)
     data["_api_duration_ms"] = duration_ms
     return data
 
@@ -519,6 +814,9 @@ def parse_solar_segments(solar_data: Dict[str, Any]) -> List[RoofSegment]:
     We calculate:
       - true_area = footprint / cos(pitch)  (3D surface area)
       - pitch_ratio = round(tan(pitch) * 12) as "X:12"
+
+    The slope multiplier is evaluated once per segment and shared by the
+    sqft and sqm areas (both are the same footprint in different units).
     """
     solar_potential = solar_data.get("solarPotential", {})
     raw_segments = solar_potential.get("roofSegmentStats", [])
@@ -530,8 +828,9 @@ def parse_solar_segments(solar_data: Dict[str, Any]) -> List[RoofSegment]:
         footprint_sqm = seg.get("stats", {}).get("areaMeters2", 0)
         footprint_sqft = footprint_sqm * SQFT_PER_SQM
 
-        true_area_sqft = true_area_from_footprint(footprint_sqft, pitch_deg)
-        true_area_sqm = true_area_from_footprint(footprint_sqm, pitch_deg)
+        area_mult = _pitch_area_multiplier(pitch_deg)
+        true_area_sqft = footprint_sqft * area_mult
+        true_area_sqm = footprint_sqm * area_mult
 
         segments.append(RoofSegment(
             name=f"Segment {i + 1}",
@@ -542,7 +841,8 @@ def parse_solar_segments(solar_data: Dict[str, Any]) -> List[RoofSegment]:
             pitch_ratio=pitch_to_ratio(pitch_deg),
             azimuth_degrees=round(azimuth_deg * 10) / 10,
             azimuth_direction=degrees_to_cardinal(azimuth_deg),
-            plane_height_meters=seg.get("planeHeightAtCenterMeters")
+            plane_height_meters=seg.get("planeHeightAtCenterMeters"),
+            area_multiplier=round(area_mult * 1000) / 1000
         ))
 
     return segments
@@ -552,6 +852,13 @@ def parse_solar_segments(solar_data: Dict[str, Any]) -> List[RoofSegment]:
 # EDGE GENERATION ENGINE
 # ==============================================================================
 
+EDGE_TYPES = ("ridge", "hip", "valley", "eave", "rake")
+HIP_LABELS = ("NE Hip", "NW Hip", "SE Hip", "SW Hip")
+VALLEY_LABELS = ("East Valley", "West Valley")
+RAKE_LABELS = ("East Rake (Left)", "East Rake (Right)",
+               "West Rake (Left)", "West Rake (Right)")
+
+
 def generate_edges(segments: List[RoofSegment], total_footprint_sqft: float) -> List[EdgeMeasurement]:
     """
     Derive roof edges from segment data using geometric estimation.
@@ -567,150 +874,113 @@ def generate_edges(segments: List[RoofSegment], total_footprint_sqft: float) ->
     All hip/valley edges get 3D length factors applied:
       hip_valley_factor = sqrt(2*rise^2 + 288) / (12*sqrt(2))
     """
-    edges = []
     if not segments:
-        return edges
+        return []
 
-    # Estimate building dimensions from footprint (1.5:1 ratio)
-    building_width_ft = math.sqrt(total_footprint_sqft / 1.5)
+    # Estimate building dimensions from footprint (1.5:1 ratio):
+    # width = sqrt(footprint / 1.5), length = 1.5 * width
+    building_width_ft = math.sqrt(total_footprint_sqft) * _INV_SQRT1_5
     building_length_ft = building_width_ft * 1.5
 
     # Average pitch for factor calculations
     avg_pitch = sum(s.pitch_degrees for s in segments) / len(segments)
     n = len(segments)
 
-    # ---- RIDGE LINES ----
-    main_ridge_plan_ft = building_length_ft * 0.85
-    edges.append(EdgeMeasurement(
-        edge_type="ridge",
-        label="Main Ridge Line",
-        plan_length_ft=round(main_ridge_plan_ft),
-        true_length_ft=round(main_ridge_plan_ft),  # Ridges are horizontal
-        pitch_factor=1.0,
-        adjacent_segments=[0, 1]
-    ))
+    # Collect (edge_type, label, plan_length_ft, pitch_factor, adjacent_segments)
+    # rows first; dataclasses are built in one pass at the end.
+    rows = []
 
+    # ---- RIDGE LINES ---- (horizontal, factor 1.0)
+    rows.append(("ridge", "Main Ridge Line", building_length_ft * 0.85, 1.0, [0, 1]))
     if n >= 4:
-        wing_ridge_plan_ft = building_width_ft * 0.5
-        edges.append(EdgeMeasurement(
-            edge_type="ridge",
-            label="Wing Ridge Line",
-            plan_length_ft=round(wing_ridge_plan_ft),
-            true_length_ft=round(wing_ridge_plan_ft),
-            pitch_factor=1.0,
-            adjacent_segments=[2, 3]
-        ))
+        rows.append(("ridge", "Wing Ridge Line", building_width_ft * 0.5, 1.0, [2, 3]))
 
-    # ---- HIP LINES ----
     if n >= 4:
-        hip_plan_ft = building_width_ft / 2 * math.sqrt(2)  # diagonal to corner
         hv_factor = hip_valley_factor(avg_pitch)
-        hip_true_ft = hip_plan_ft * hv_factor
-
-        for label in ["NE Hip", "NW Hip", "SE Hip", "SW Hip"]:
-            edges.append(EdgeMeasurement(
-                edge_type="hip",
-                label=label,
-                plan_length_ft=round(hip_plan_ft),
-                true_length_ft=round(hip_true_ft),
-                pitch_factor=round(hv_factor * 1000) / 1000
-            ))
 
-    # ---- VALLEY LINES ----
-    if n >= 4:
+        # ---- HIP LINES ---- (diagonal to corner)
+        hip_plan_ft = building_width_ft * 0.5 * _SQRT2
+        rows.extend(("hip", label, hip_plan_ft, hv_factor, None) for label in HIP_LABELS)
+
+        # ---- VALLEY LINES ----
         valley_plan_ft = building_width_ft * 0.35
-        vf = hip_valley_factor(avg_pitch)
-        valley_true_ft = valley_plan_ft * vf
-
-        for label in ["East Valley", "West Valley"]:
-            edges.append(EdgeMeasurement(
-                edge_type="valley",
-                label=label,
-                plan_length_ft=round(valley_plan_ft),
-                true_length_ft=round(valley_true_ft),
-                pitch_factor=round(vf * 1000) / 1000
-            ))
+        rows.extend(("valley", label, valley_plan_ft, hv_factor, None) for label in VALLEY_LABELS)
 
-    # ---- EAVE LINES ----
-    if n >= 4:
-        eave_sections = [
-            ("South Eave", building_length_ft * 0.9),
-            ("North Eave", building_length_ft * 0.9),
-            ("East Eave", building_width_ft * 0.4),
-            ("West Eave", building_width_ft * 0.4),
-        ]
+        # ---- EAVE LINES ---- (horizontal)
+        rows.append(("eave", "South Eave", building_length_ft * 0.9, 1.0, None))
+        rows.append(("eave", "North Eave", building_length_ft * 0.9, 1.0, None))
+        rows.append(("eave", "East Eave", building_width_ft * 0.4, 1.0, None))
+        rows.append(("eave", "West Eave", building_width_ft * 0.4, 1.0, None))
     else:
-        eave_sections = [
-            ("South Eave", building_length_ft * 0.95),
-            ("North Eave", building_length_ft * 0.95),
-        ]
+        rows.append(("eave", "South Eave", building_length_ft * 0.95, 1.0, None))
+        rows.append(("eave", "North Eave", building_length_ft * 0.95, 1.0, None))
 
-    for label, length in eave_sections:
-        edges.append(EdgeMeasurement(
-            edge_type="eave",
-            label=label,
-            plan_length_ft=round(length),
-            true_length_ft=round(length),  # Eaves are horizontal
-            pitch_factor=1.0
-        ))
-
-    # ---- RAKE EDGES ----
-    if n <= 3:
-        # Gable roof -- has rakes at each end
-        rake_plan_ft = building_width_ft / 2
+        # ---- RAKE EDGES ---- Gable roof -- has rakes at each end
         rf = rake_factor(avg_pitch)
-        rake_true_ft = rake_plan_ft * rf
-
-        for label in ["East Rake (Left)", "East Rake (Right)",
-                       "West Rake (Left)", "West Rake (Right)"]:
-            edges.append(EdgeMeasurement(
-                edge_type="rake",
-                label=label,
-                plan_length_ft=round(rake_plan_ft),
-                true_length_ft=round(rake_true_ft),
-                pitch_factor=round(rf * 1000) / 1000
-            ))
+        rake_plan_ft = building_width_ft / 2
+        rows.extend(("rake", label, rake_plan_ft, rf, None) for label in RAKE_LABELS)
 
-    return edges
+    return [
+        EdgeMeasurement(
+            edge_type=edge_type,
+            label=label,
+            plan_length_ft=round(plan_ft),
+            true_length_ft=round(plan_ft * factor),
+            pitch_factor=round(factor * 1000) / 1000,
+            adjacent_segments=adjacent,
+        )
+        for edge_type, label, plan_ft, factor, adjacent in rows
+    ]
 
 
 def compute_edge_summary(edges: List[EdgeMeasurement]) -> EdgeSummary:
     """Aggregate edge measurements by type."""
-    summary = EdgeSummary()
+    totals = defaultdict(float)
+    counts = defaultdict(int)
     for e in edges:
-        if e.edge_type == "ridge":
-            summary.total_ridge_ft += e.true_length_ft
-        elif e.edge_type == "hip":
-            summary.total_hip_ft += e.true_length_ft
-        elif e.edge_type == "valley":
-            summary.total_valley_ft += e.true_length_ft
-        elif e.edge_type == "eave":
-            summary.total_eave_ft += e.true_length_ft
-        elif e.edge_type == "rake":
-            summary.total_rake_ft += e.true_length_ft
-
-    summary.total_ridge_ft = round(summary.total_ridge_ft)
-    summary.total_hip_ft = round(summary.total_hip_ft)
-    summary.total_valley_ft = round(summary.total_valley_ft)
-    summary.total_eave_ft = round(summary.total_eave_ft)
-    summary.total_rake_ft = round(summary.total_rake_ft)
-    summary.total_linear_ft = round(
-        summary.total_ridge_ft + summary.total_hip_ft +
-        summary.total_valley_ft + summary.total_eave_ft +
-        summary.total_rake_ft
+        totals[e.edge_type] += e.true_length_ft
+        counts[e.edge_type] += 1
+
+    # Round each type once; the total is the (already integral) sum of the
+    # rounded figures so the report breakdown adds up exactly
+    ridge, hip, valley, eave, rake = [round(totals[t]) for t in EDGE_TYPES]
+    return EdgeSummary(
+        total_ridge_ft=ridge,
+        total_hip_ft=hip,
+        total_valley_ft=valley,
+        total_eave_ft=eave,
+        total_rake_ft=rake,
+        total_linear_ft=ridge + hip + valley + eave + rake,
+        hip_count=counts["hip"],
+        valley_count=counts["valley"],
     )
-    return summary
 
 
 # ==============================================================================
 # MATERIAL ESTIMATE (BILL OF MATERIALS)
 # ==============================================================================
 
+def _round1(value: float) -> float:
+    """Round to one decimal place, i.e. round(value * 10) / 10."""
+    return round(value * 10) / 10
+
+
+def _round2(value: float) -> float:
+    """Round a currency amount to cents, i.e. round(value * 100) / 100."""
+    return round(value * 100) / 100
+
+
+def _ceildiv(a: int, b: int) -> int:
+    """Integer ceiling division (exact for ints, no float round trip)."""
+    return -(-a // b)
+
+
 def compute_material_estimate(
     true_area_sqft: float,
     edges: List[EdgeMeasurement],
     segments: List[RoofSegment],
-    shingle_type: str = "architectural"
+    shingle_type: str = "architectural",
+    edge_summary: Optional[EdgeSummary] = None
 ) -> MaterialEstimate:
     """
     Compute a complete Bill of Materials for a roofing project.
@@ -727,193 +997,135 @@ def compute_material_estimate(
     9. Ridge Vent (4 ft sections)
 
     Pricing: Alberta CAD market rates.
+
+    Pass the report's ``edge_summary`` to reuse its per-type totals and
+    counts; otherwise it is aggregated from ``edges`` here.
     """
-    # Classify edges
-    hip_edges = [e for e in edges if e.edge_type == "hip"]
-    valley_edges = [e for e in edges if e.edge_type == "valley"]
-    ridge_edges = [e for e in edges if e.edge_type == "ridge"]
-    eave_edges = [e for e in edges if e.edge_type == "eave"]
-    rake_edges = [e for e in edges if e.edge_type == "rake"]
+    if edge_summary is None:
+        edge_summary = compute_edge_summary(edges)
 
     # Pitch variation for complexity
-    pitches = [s.pitch_degrees for s in segments]
-    pitch_variation = max(pitches) - min(pitches) if pitches else 0
+    pitch_variation = 0
+    if segments:
+        pitch_min = pitch_max = segments[0].pitch_degrees
+        for s in segments:
+            pitch = s.pitch_degrees
+            if pitch < pitch_min:
+                pitch_min = pitch
+            elif pitch > pitch_max:
+                pitch_max = pitch
+        pitch_variation = pitch_max - pitch_min
 
     complexity_factor, complexity_class = classify_complexity(
-        len(segments), len(hip_edges), len(valley_edges), pitch_variation
+        len(segments), edge_summary.hip_count, edge_summary.valley_count, pitch_variation
     )
 
     # Base waste percentage
-    waste_map = {"simple": 10, "moderate": 12, "complex": 14, "very_complex": 15}
-    base_waste = waste_map.get(complexity_class, 10)
+    base_waste = WASTE_MAP.get(complexity_class, 10)
 
     net_area = true_area_sqft
     gross_area = net_area * (1 + base_waste / 100)
     gross_squares = math.ceil(gross_area / 100 * 10) / 10
     bundle_count = math.ceil(gross_squares * 3)
 
-    # Edge totals
-    total_ridge_ft = sum(e.true_length_ft for e in ridge_edges)
-    total_hip_ft = sum(e.true_length_ft for e in hip_edges)
-    total_valley_ft = sum(e.true_length_ft for e in valley_edges)
-    total_eave_ft = sum(e.true_length_ft for e in eave_edges)
-    total_rake_ft = sum(e.true_length_ft for e in rake_edges)
+    # Edge totals (whole feet, so the piece counts below use integer ceil-div)
+    total_ridge_ft = edge_summary.total_ridge_ft
+    total_hip_ft = edge_summary.total_hip_ft
+    total_valley_ft = edge_summary.total_valley_ft
+    total_eave_ft = edge_summary.total_eave_ft
+    total_rake_ft = edge_summary.total_rake_ft
+
+    # Unit prices, looked up once per estimate
+    pricing = PRICING
+    price_per_bundle = pricing["architectural_bundle"] if shingle_type == "architectural" else pricing["3tab_bundle"]
+    underlayment_price = pricing["underlayment_roll"]
+    ice_shield_price = pricing["ice_shield_roll"]
+    starter_price = pricing["starter_bundle"]
+    ridge_cap_price = pricing["ridge_cap_bundle"]
+    drip_edge_price = pricing["drip_edge_piece"]
+    valley_price = pricing["valley_flashing_piece"]
+    nail_box_price = pricing["nail_box_30lb"]
+    ridge_vent_price = pricing["ridge_vent_piece"]
+
+    # Quantities
+    shingle_name = "Architectural (Laminate)" if shingle_type == "architectural" else "3-Tab Standard"
+    underlayment_rolls = math.ceil(gross_area / 1000)
+    ice_shield_linear_ft = total_eave_ft + total_valley_ft
+    ice_shield_sqft = ice_shield_linear_ft * 3  # 3 ft wide
+    ice_shield_rolls = _ceildiv(ice_shield_sqft, 75)
+    starter_linear_ft = total_eave_ft + total_rake_ft
+    starter_bundles = _ceildiv(starter_linear_ft, 105)
+    ridge_hip_linear_ft = total_ridge_ft + total_hip_ft
+    ridge_cap_bundles = _ceildiv(ridge_hip_linear_ft, 33)
+    drip_edge_linear_ft = total_eave_ft + total_rake_ft
+    drip_edge_pieces = _ceildiv(drip_edge_linear_ft, 10)
+    valley_pieces = _ceildiv(total_valley_ft, 10)
+    nail_lbs = math.ceil(gross_squares * 1.5)
+    nail_boxes = _ceildiv(nail_lbs, 30)
+    vent_pieces = _ceildiv(total_ridge_ft, 4)
 
+    # Line items in report order. Edge-driven items are skipped when the roof
+    # has none of those edges; shingles, underlayment and nails always appear.
     line_items = []
 
-    # 1. Shingles
-    price_per_bundle = PRICING["architectural_bundle"] if shingle_type == "architectural" else PRICING["3tab_bundle"]
-    line_items.append(MaterialLineItem(
-        category="shingles",
-        description=f"{'Architectural (Laminate)' if shingle_type == 'architectural' else '3-Tab Standard'} Shingles",
-        unit="squares",
-        net_quantity=round(net_area / 100 * 10) / 10,
-        waste_pct=base_waste,
-        gross_quantity=gross_squares,
-        order_quantity=bundle_count,
-        order_unit="bundles",
-        unit_price_cad=price_per_bundle,
-        line_total_cad=round(bundle_count * price_per_bundle * 100) / 100
-    ))
+    def add_item(**fields):
+        line_total = _round2(fields["order_quantity"] * fields["unit_price_cad"])
+        line_items.append(MaterialLineItem(**fields, line_total_cad=line_total))
 
+    # 1. Shingles
+    add_item(category="shingles", description=f"{shingle_name} Shingles", unit="squares",
+             net_quantity=_round1(net_area / 100), waste_pct=base_waste, gross_quantity=gross_squares,
+             order_quantity=bundle_count, order_unit="bundles", unit_price_cad=price_per_bundle)
     # 2. Underlayment
-    underlayment_rolls = math.ceil(gross_area / 1000)
-    line_items.append(MaterialLineItem(
-        category="underlayment",
-        description="Synthetic Underlayment",
-        unit="rolls",
-        net_quantity=math.ceil(net_area / 1000),
-        waste_pct=10,
-        gross_quantity=underlayment_rolls,
-        order_quantity=underlayment_rolls,
-        order_unit="rolls",
-        unit_price_cad=PRICING["underlayment_roll"],
-        line_total_cad=round(underlayment_rolls * PRICING["underlayment_roll"] * 100) / 100
-    ))
-
+    add_item(category="underlayment", description="Synthetic Underlayment", unit="rolls",
+             net_quantity=math.ceil(net_area / 1000), waste_pct=10, gross_quantity=underlayment_rolls,
+             order_quantity=underlayment_rolls, order_unit="rolls", unit_price_cad=underlayment_price)
     # 3. Ice & Water Shield
-    ice_shield_linear_ft = total_eave_ft + total_valley_ft
-    ice_shield_sqft = ice_shield_linear_ft * 3  # 3 ft wide
-    ice_shield_rolls = math.ceil(ice_shield_sqft / 75)
-    line_items.append(MaterialLineItem(
-        category="ice_shield",
-        description="Ice & Water Shield Membrane",
-        unit="rolls",
-        net_quantity=math.ceil(ice_shield_sqft / 75),
-        waste_pct=5,
-        gross_quantity=ice_shield_rolls,
-        order_quantity=ice_shield_rolls,
-        order_unit="rolls",
-        unit_price_cad=PRICING["ice_shield_roll"],
-        line_total_cad=round(ice_shield_rolls * PRICING["ice_shield_roll"] * 100) / 100
-    ))
-
+    if ice_shield_linear_ft > 0:
+        add_item(category="ice_shield", description="Ice & Water Shield Membrane", unit="rolls",
+                 net_quantity=ice_shield_rolls, waste_pct=5, gross_quantity=ice_shield_rolls,
+                 order_quantity=ice_shield_rolls, order_unit="rolls", unit_price_cad=ice_shield_price)
     # 4. Starter Strip
-    starter_linear_ft = total_eave_ft + total_rake_ft
-    starter_bundles = math.ceil(starter_linear_ft / 105)
-    line_items.append(MaterialLineItem(
-        category="starter_strip",
-        description="Starter Strip Shingles",
-        unit="linear_ft",
-        net_quantity=round(starter_linear_ft),
-        waste_pct=5,
-        gross_quantity=round(starter_linear_ft * 1.05),
-        order_quantity=starter_bundles,
-        order_unit="bundles",
-        unit_price_cad=PRICING["starter_bundle"],
-        line_total_cad=round(starter_bundles * PRICING["starter_bundle"] * 100) / 100
-    ))
-
+    if starter_linear_ft > 0:
+        add_item(category="starter_strip", description="Starter Strip Shingles", unit="linear_ft",
+                 net_quantity=round(starter_linear_ft), waste_pct=5,
+                 gross_quantity=round(starter_linear_ft * 1.05),
+                 order_quantity=starter_bundles, order_unit="bundles", unit_price_cad=starter_price)
     # 5. Ridge/Hip Cap
-    ridge_hip_linear_ft = total_ridge_ft + total_hip_ft
-    ridge_cap_bundles = math.ceil(ridge_hip_linear_ft / 33)
-    line_items.append(MaterialLineItem(
-        category="ridge_cap",
-        description="Ridge/Hip Cap Shingles",
-        unit="linear_ft",
-        net_quantity=round(ridge_hip_linear_ft),
-        waste_pct=5,
-        gross_quantity=round(ridge_hip_linear_ft * 1.05),
-        order_quantity=ridge_cap_bundles,
-        order_unit="bundles",
-        unit_price_cad=PRICING["ridge_cap_bundle"],
-        line_total_cad=round(ridge_cap_bundles * PRICING["ridge_cap_bundle"] * 100) / 100
-    ))
-
+    if ridge_hip_linear_ft > 0:
+        add_item(category="ridge_cap", description="Ridge/Hip Cap Shingles", unit="linear_ft",
+                 net_quantity=round(ridge_hip_linear_ft), waste_pct=5,
+                 gross_quantity=round(ridge_hip_linear_ft * 1.05),
+                 order_quantity=ridge_cap_bundles, order_unit="bundles", unit_price_cad=ridge_cap_price)
     # 6. Drip Edge
-    drip_edge_linear_ft = total_eave_ft + total_rake_ft
-    drip_edge_pieces = math.ceil(drip_edge_linear_ft / 10)
-    line_items.append(MaterialLineItem(
-        category="drip_edge",
-        description="Aluminum Drip Edge (10 ft sections)",
-        unit="pieces",
-        net_quantity=math.ceil(drip_edge_linear_ft / 10),
-        waste_pct=5,
-        gross_quantity=drip_edge_pieces,
-        order_quantity=drip_edge_pieces,
-        order_unit="pieces",
-        unit_price_cad=PRICING["drip_edge_piece"],
-        line_total_cad=round(drip_edge_pieces * PRICING["drip_edge_piece"] * 100) / 100
-    ))
-
+    if drip_edge_linear_ft > 0:
+        add_item(category="drip_edge", description="Aluminum Drip Edge (10 ft sections)", unit="pieces",
+                 net_quantity=drip_edge_pieces, waste_pct=5, gross_quantity=drip_edge_pieces,
+                 order_quantity=drip_edge_pieces, order_unit="pieces", unit_price_cad=drip_edge_price)
     # 7. Valley Flashing
     if total_valley_ft > 0:
-        valley_pieces = math.ceil(total_valley_ft / 10)
-        line_items.append(MaterialLineItem(
-            category="valley_metal",
-            description="Pre-bent Valley Flashing (W-valley, 10 ft)",
-            unit="pieces",
-            net_quantity=math.ceil(total_valley_ft / 10),
-            waste_pct=10,
-            gross_quantity=valley_pieces,
-            order_quantity=valley_pieces,
-            order_unit="pieces",
-            unit_price_cad=PRICING["valley_flashing_piece"],
-            line_total_cad=round(valley_pieces * PRICING["valley_flashing_piece"] * 100) / 100
-        ))
-
+        add_item(category="valley_metal", description="Pre-bent Valley Flashing (W-valley, 10 ft)", unit="pieces",
+                 net_quantity=valley_pieces, waste_pct=10, gross_quantity=valley_pieces,
+                 order_quantity=valley_pieces, order_unit="pieces", unit_price_cad=valley_price)
     # 8. Nails
-    nail_lbs = math.ceil(gross_squares * 1.5)
-    nail_boxes = math.ceil(nail_lbs / 30)
-    line_items.append(MaterialLineItem(
-        category="nails",
-        description="1-1/4\" Galvanized Roofing Nails (30 lb box)",
-        unit="lbs",
-        net_quantity=round(gross_squares * 1.5),
-        waste_pct=0,
-        gross_quantity=nail_lbs,
-        order_quantity=nail_boxes,
-        order_unit="boxes",
-        unit_price_cad=PRICING["nail_box_30lb"],
-        line_total_cad=round(nail_boxes * PRICING["nail_box_30lb"] * 100) / 100
-    ))
-
+    add_item(category="nails", description="1-1/4\" Galvanized Roofing Nails (30 lb box)", unit="lbs",
+             net_quantity=round(gross_squares * 1.5), waste_pct=0, gross_quantity=nail_lbs,
+             order_quantity=nail_boxes, order_unit="boxes", unit_price_cad=nail_box_price)
     # 9. Ridge Vent
     if total_ridge_ft > 0:
-        vent_pieces = math.ceil(total_ridge_ft / 4)
-        line_items.append(MaterialLineItem(
-            category="ventilation",
-            description="Ridge Vent (4 ft sections)",
-            unit="pieces",
-            net_quantity=math.ceil(total_ridge_ft / 4),
-            waste_pct=5,
-            gross_quantity=vent_pieces,
-            order_quantity=vent_pieces,
-            order_unit="pieces",
-            unit_price_cad=PRICING["ridge_vent_piece"],
-            line_total_cad=round(vent_pieces * PRICING["ridge_vent_piece"] * 100) / 100
-        ))
-
+        add_item(category="ventilation", description="Ridge Vent (4 ft sections)", unit="pieces",
+                 net_quantity=vent_pieces, waste_pct=5, gross_quantity=vent_pieces,
+                 order_quantity=vent_pieces, order_unit="pieces", unit_price_cad=ridge_vent_price)
     total_cost = sum(item.line_total_cad for item in line_items)
 
     return MaterialEstimate(
         net_area_sqft=round(net_area),
         waste_pct=base_waste,
         gross_area_sqft=round(gross_area),
-        gross_squares=round(gross_squares * 10) / 10,
+        gross_squares=_round1(gross_squares),
         bundle_count=bundle_count,
         line_items=line_items,
-        total_material_cost_cad=round(total_cost * 100) / 100,
+        total_material_cost_cad=_round2(total_cost),
         complexity_factor=complexity_factor,
         complexity_class=complexity_class,
         shingle_type=shingle_type
@@ -924,13 +1136,9 @@ def compute_material_estimate(
 # WASTE TABLE GENERATION
 # ==============================================================================
 
-def generate_waste_table(total_sqft: float) -> List[Dict]:
-    """
-    Generate a comparison table of waste scenarios.
-
-    Factors: 1.05, 1.10, 1.15, 1.20 (5%, 10%, 15%, 20% overage)
-    Includes: total sqft, squares (sqft/100), and bundles (squares*3)
-    """
+@lru_cache(maxsize=256)
+def _waste_table_rows(total_sqft: float) -> Tuple[Dict, ...]:
+    """Compute the waste scenario rows for one area (cached; never mutate)."""
     table = []
     for pct, factor, description in WASTE_FACTORS:
         gross_sqft = total_sqft * factor
@@ -941,16 +1149,40 @@ def generate_waste_table(total_sqft: float) -> List[Dict]:
             "factor": factor,
             "description": description,
             "gross_sqft": round(gross_sqft),
-            "squares": round(squares * 10) / 10,
+            "squares": _round1(squares),
             "bundles": bundles
         })
-    return table
+    return tuple(table)
+
+
+def generate_waste_table(total_sqft: float) -> List[Dict]:
+    """
+    Generate a comparison table of waste scenarios.
+
+    Factors: 1.05, 1.10, 1.15, 1.20 (5%, 10%, 15%, 20% overage)
+    Includes: total sqft, squares (sqft/100), and bundles (squares*3)
+
+    Rows are memoized per area; each call gets its own shallow copies so the
+    report can own (and callers can edit) the returned table.
+    """
+    return [dict(row) for row in _waste_table_rows(total_sqft)]
 
 
 # ==============================================================================
 # RAS YIELD ANALYSIS (Reuse Canada Value-Add)
 # ==============================================================================
 
+# RAS recovery classes, indexed by class id (0 = low, 1 = medium, 2 = high pitch)
+RAS_RECOVERY_CLASSES = ("binder_oil", "mixed", "granule")
+# (binder oil, granule, fiber) recovery rates per class id, as a fraction of
+# shingle weight
+RAS_YIELD_RATES = (
+    (0.32, 0.33, 0.08),
+    (0.28, 0.36, 0.07),
+    (0.25, 0.40, 0.06),
+)
+
+
 def compute_ras_yield(
     segments: List[RoofSegment],
     true_area_sqft: float,
@@ -979,41 +1211,45 @@ def compute_ras_yield(
     total_weight = total_squares * weight_per_square
 
     ras_segments = []
+    class_area = [0, 0, 0]  # segment area per class id (slope distribution)
+    # Running totals of the rounded per-segment yields
+    total_oil = total_granules = total_fiber = 0
     for seg in segments:
-        pitch_rise = 12 * math.tan(math.radians(seg.pitch_degrees))
+        pitch_rise = _pitch_rise_12(seg.pitch_degrees)
 
         if pitch_rise <= 4:
-            recovery_class = "binder_oil"
+            class_id = 0
         elif pitch_rise > 6:
-            recovery_class = "granule"
+            class_id = 2
         else:
-            recovery_class = "mixed"
+            class_id = 1
+        class_area[class_id] += seg.true_area_sqft
 
         seg_squares = seg.true_area_sqft / 100
         seg_weight = seg_squares * weight_per_square
 
         # Yield rates by class
-        binder_rate = {"binder_oil": 0.32, "mixed": 0.28, "granule": 0.25}[recovery_class]
-        granule_rate = {"granule": 0.40, "mixed": 0.36, "binder_oil": 0.33}[recovery_class]
-        fiber_rate = {"binder_oil": 0.08, "mixed": 0.07, "granule": 0.06}[recovery_class]
+        binder_rate, granule_rate, fiber_rate = RAS_YIELD_RATES[class_id]
 
         binder_oil_lbs = seg_weight * binder_rate
-        binder_oil_gallons = binder_oil_lbs / 8
+        binder_oil_gallons = _round1(binder_oil_lbs / 8)
+        granules_lbs = round(seg_weight * granule_rate)
+        fiber_lbs = round(seg_weight * fiber_rate)
+        total_oil += binder_oil_gallons
+        total_granules += granules_lbs
+        total_fiber += fiber_lbs
 
         ras_segments.append(RASSegmentYield(
             segment_name=seg.name,
             pitch_degrees=seg.pitch_degrees,
             pitch_ratio=seg.pitch_ratio,
             area_sqft=seg.true_area_sqft,
-            recovery_class=recovery_class,
-            binder_oil_gallons=round(binder_oil_gallons * 10) / 10,
-            granules_lbs=round(seg_weight * granule_rate),
-            fiber_lbs=round(seg_weight * fiber_rate)
+            recovery_class=RAS_RECOVERY_CLASSES[class_id],
+            binder_oil_gallons=binder_oil_gallons,
+            granules_lbs=granules_lbs,
+            fiber_lbs=fiber_lbs
         ))
 
-    total_oil = sum(s.binder_oil_gallons for s in ras_segments)
-    total_granules = sum(s.granules_lbs for s in ras_segments)
-    total_fiber = sum(s.fiber_lbs for s in ras_segments)
     total_recoverable = (total_oil * 8) + total_granules + total_fiber
 
     # Market values (Alberta CAD)
@@ -1022,9 +1258,7 @@ def compute_ras_yield(
     fiber_value = total_fiber * 0.12
 
     # Slope distribution
-    low_pitch_area = sum(s.area_sqft for s in ras_segments if s.recovery_class == "binder_oil")
-    med_pitch_area = sum(s.area_sqft for s in ras_segments if s.recovery_class == "mixed")
-    high_pitch_area = sum(s.area_sqft for s in ras_segments if s.recovery_class == "granule")
+    low_pitch_area, med_pitch_area, high_pitch_area = class_area
     total_area = low_pitch_area + med_pitch_area + high_pitch_area or 1
 
     low_pct = (low_pitch_area / total_area) * 100
@@ -1045,23 +1279,23 @@ def compute_ras_yield(
 
     return RASYieldAnalysis(
         total_area_sqft=round(true_area_sqft),
-        total_squares=round(total_squares * 10) / 10,
+        total_squares=_round1(total_squares),
         estimated_weight_lbs=round(total_weight),
         segments=ras_segments,
-        total_binder_oil_gallons=round(total_oil * 10) / 10,
+        total_binder_oil_gallons=_round1(total_oil),
         total_granules_lbs=round(total_granules),
         total_fiber_lbs=round(total_fiber),
         total_recoverable_lbs=round(total_recoverable),
         recovery_rate_pct=round((total_recoverable / (total_weight or 1)) * 1000) / 10,
-        market_value_oil_cad=round(oil_value * 100) / 100,
-        market_value_granules_cad=round(granule_value * 100) / 100,
-        market_value_fiber_cad=round(fiber_value * 100) / 100,
-        market_value_total_cad=round((oil_value + granule_value + fiber_value) * 100) / 100,
+        market_value_oil_cad=_round2(oil_value),
+        market_value_granules_cad=_round2(granule_value),
+        market_value_fiber_cad=_round2(fiber_value),
+        market_value_total_cad=_round2(oil_value + granule_value + fiber_value),
         processing_recommendation=recommendation,
         slope_distribution={
-            "low_pitch_pct": round(low_pct * 10) / 10,
-            "medium_pitch_pct": round(((med_pitch_area / total_area) * 100) * 10) / 10,
-            "high_pitch_pct": round(high_pct * 10) / 10
+            "low_pitch_pct": _round1(low_pct),
+            "medium_pitch_pct": _round1((med_pitch_area / total_area) * 100),
+            "high_pitch_pct": _round1(high_pct)
         }
     )
 
@@ -1070,80 +1304,179 @@ def compute_ras_yield(
 # COMPARISON TABLE: Manual vs Automated Inspection
 # ==============================================================================
 
+# Manual vs Automated inspection comparison rows (static)
+COMPARISON_TABLE = (
+    {
+        "metric": "Cost per Property",
+        "manual": "$150 - $400",
+        "automated": "$0.075 (API query)",
+        "advantage": "automated",
+        "savings": "99.95%"
+    },
+    {
+        "metric": "Time per Report",
+        "manual": "2 - 5 hours (field + office)",
+        "automated": "< 3 seconds",
+        "advantage": "automated",
+        "savings": "99.97%"
+    },
+    {
+        "metric": "Measurement Accuracy",
+        "manual": "95 - 97% (trained estimator)",
+        "automated": "98.77% (Google Solar HIGH)",
+        "advantage": "automated",
+        "savings": "+1.8%"
+    },
+    {
+        "metric": "Weather Dependency",
+        "manual": "Cannot inspect in rain/snow/ice",
+        "automated": "24/7, any weather",
+        "advantage": "automated",
+        "savings": "N/A"
+    },
+    {
+        "metric": "Safety Risk",
+        "manual": "High (ladder/roof access)",
+        "automated": "Zero (remote sensing)",
+        "advantage": "automated",
+        "savings": "100%"
+    },
+    {
+        "metric": "Scalability",
+        "manual": "1-3 properties/day",
+        "automated": "600+ properties/hour",
+        "advantage": "automated",
+        "savings": "200x+"
+    },
+    {
+        "metric": "Edge Measurements",
+        "manual": "Direct measurement on-site",
+        "automated": "Calculated from 3D geometry model",
+        "advantage": "manual",
+        "savings": "N/A"
+    },
+    {
+        "metric": "Penetration Detection",
+        "manual": "Visual inspection (chimneys, vents, skylights)",
+        "automated": "AI Vision analysis (Gemini)",
+        "advantage": "tie",
+        "savings": "N/A"
+    },
+    {
+        "metric": "Material BOM Accuracy",
+        "manual": "Based on experience + field notes",
+        "automated": "Algorithmic (from 3D surface area + edge lengths)",
+        "advantage": "automated",
+        "savings": "Reduced waste"
+    },
+    {
+        "metric": "Report Generation",
+        "manual": "Manual typing, 30-60 min",
+        "automated": "Automated 3-page HTML, < 1 sec",
+        "advantage": "automated",
+        "savings": "99%+"
+    },
+)
+
+
 def generate_comparison_table() -> List[Dict]:
     """Generate Manual vs Automated inspection comparison data."""
-    return [
-        {
-            "metric": "Cost per Property",
-            "manual": "$150 - $400",
-            "automated": "$0.075 (API query)",
-            "advantage": "automated",
-            "savings": "99.95%"
-        },
-        {
-            "metric": "Time per Report",
-            "manual": "2 - 5 hours (field + office)",
-            "automated": "< 3 seconds",
-            "advantage": "automated",
-            "savings": "99.97%"
-        },
-        {
-            "metric": "Measurement Accuracy",
-            "manual": "95 - 97% (trained estimator)",
-            "automated": "98.77% (Google Solar HIGH)",
-            "advantage": "automated",
-            "savings": "+1.8%"
-        },
-        {
-            "metric": "Weather Dependency",
-            "manual": "Cannot inspect in rain/snow/ice",
-            "automated": "24/7, any weather",
-            "advantage": "automated",
-            "savings": "N/A"
-        },
-        {
-            "metric": "Safety Risk",
-            "manual": "High (ladder/roof access)",
-            "automated": "Zero (remote sensing)",
-            "advantage": "automated",
-            "savings": "100%"
-        },
-        {
-            "metric": "Scalability",
-            "manual": "1-3 properties/day",
-            "automated": "600+ properties/hour",
-            "advantage": "automated",
-            "savings": "200x+"
-        },
-        {
-            "metric": "Edge Measurements",
-            "manual": "Direct measurement on-site",
-            "automated": "Calculated from 3D geometry model",
-            "advantage": "manual",
-            "savings": "N/A"
-        },
-        {
-            "metric": "Penetration Detection",
-            "manual": "Visual inspection (chimneys, vents, skylights)",
-            "automated": "AI Vision analysis (Gemini)",
-            "advantage": "tie",
-            "savings": "N/A"
-        },
-        {
-            "metric": "Material BOM Accuracy",
-            "manual": "Based on experience + field notes",
-            "automated": "Algorithmic (from 3D surface area + edge lengths)",
-            "advantage": "automated",
-            "savings": "Reduced waste"
-        },
-        {
-            "metric": "Report Generation",
-            "manual": "Manual typing, 30-60 min",
-            "automated": "Automated 3-page HTML, < 1 sec",
-            "advantage": "automated",
-            "savings": "99%+"
-        },
-    ]
+    return [dict(row) for row in COMPARISON_TABLE]
+
+
+# Static tail of the HTML report <head> (stylesheet) plus the opening <body>;
+# kept out of the per-report f-string so it is neither re-parsed nor
+# brace-escaped on every call
+_HTML_REPORT_HEAD_TAIL = """<style>
+@import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800;900&display=swap');
+*{margin:0;padding:0;box-sizing:border-box}
+body{font-family:'Inter',system-ui,sans-serif;background:#fff;color:#1a1a2e;font-size:10pt;line-height:1.4}
+@media print{.page{page-break-after:always}.page:last-child{page-break-after:auto}}
+
+/* PAGE 1: DARK DASHBOARD */
+.p1{background:linear-gradient(180deg,#0B1E2F 0%,#0F2740 50%,#0B1E2F 100%);color:#fff;min-height:11in;max-width:8.5in;margin:0 auto;padding:28px 32px;position:relative}
+.p1-header{display:flex;justify-content:space-between;align-items:flex-start;margin-bottom:18px}
+.p1-logo-icon{width:48px;height:48px;background:linear-gradient(135deg,#00E5FF,#0091EA);border-radius:10px;display:inline-flex;align-items:center;justify-content:center;font-size:20px;font-weight:900;color:#0B1E2F}
+.p1-rn{color:#00E5FF;font-size:13px;font-weight:700}
+.p1-date{color:#8ECAE6;font-size:11px}
+.p1-addr{color:#B0C4D8;font-size:12px;padding:8px 14px;background:rgba(255,255,255,0.04);border:1px solid rgba(0,229,255,0.15);border-radius:8px;margin-bottom:16px}
+.p1-section-label{color:#00E5FF;font-size:10px;font-weight:700;text-transform:uppercase;letter-spacing:2px;text-align:center;margin:12px 0 8px}
+.p1-card{background:rgba(255,255,255,0.04);border:1px solid rgba(0,229,255,0.15);border-radius:10px;padding:14px 16px}
+.p1-card-accent{border-color:rgba(0,229,255,0.5);background:rgba(0,229,255,0.06)}
+.p1-card-label{color:#8ECAE6;font-size:8px;font-weight:700;text-transform:uppercase;letter-spacing:1.5px;margin-bottom:4px}
+.p1-card-value{font-size:28px;font-weight:900;color:#00E5FF;line-height:1}
+.p1-unit{font-size:14px;color:#8ECAE6;margin-left:4px}
+.p1-tag{display:inline-block;padding:2px 10px;background:rgba(0,229,255,0.12);border:1px solid rgba(0,229,255,0.3);border-radius:20px;font-size:12px;font-weight:600;color:#00E5FF;margin-right:6px}
+.p1-squares{background:linear-gradient(135deg,rgba(0,229,255,0.15),rgba(0,229,255,0.05));border:2px solid rgba(0,229,255,0.4);border-radius:12px;padding:14px 20px;text-align:center}
+.p1-sq-num{font-size:42px;font-weight:900;color:#00E5FF}
+.p1-sq-label{font-size:11px;font-weight:700;text-transform:uppercase;letter-spacing:2px;color:#8ECAE6}
+.p1-lin-item{color:#B0C4D8;font-size:11px;display:inline-block;margin-right:16px}
+.p1-lin-item b{color:#fff;font-weight:700;font-size:13px}
+.p1-badge{padding:4px 12px;border-radius:20px;font-size:9px;font-weight:600;display:inline-block;margin:2px 4px}
+.p1-badge-high{background:rgba(0,229,255,0.15);color:#00E5FF;border:1px solid rgba(0,229,255,0.3)}
+.p1-badge-provider{background:rgba(255,255,255,0.05);color:#8ECAE6;border:1px solid rgba(255,255,255,0.1)}
+.p1-footer{text-align:center;margin-top:12px;padding-top:10px;border-top:1px solid rgba(0,229,255,0.1);color:#5A7A96;font-size:8px}
+
+/* PAGE 2: MATERIAL ORDER (Light) */
+.p2{background:#E8F4FD;min-height:11in;max-width:8.5in;margin:0 auto;padding:32px 36px}
+.p2-title{font-size:24px;font-weight:900;color:#002F6C;text-align:center;text-transform:uppercase}
+.p2-subtitle{text-align:center;color:#335C8A;font-size:12px;margin-top:4px}
+.p2-ref{text-align:center;color:#0077CC;font-size:11px;font-weight:600;margin:2px 0 24px}
+.p2-section{background:#fff;border-radius:8px;padding:18px 22px;margin-bottom:16px;border-left:4px solid #002F6C;box-shadow:0 1px 4px rgba(0,0,0,0.06)}
+.p2-section-title{font-size:13px;font-weight:800;color:#002F6C;text-transform:uppercase;letter-spacing:1px;margin-bottom:12px;padding-bottom:6px;border-bottom:2px solid #E0ECF5}
+.p2-row{display:flex;justify-content:space-between;align-items:center;padding:6px 0;border-bottom:1px solid #F0F4F8}
+.p2-row:last-child{border-bottom:none}
+.p2-row-label{color:#335C8A;font-size:12px}
+.p2-row-value{color:#002F6C;font-size:13px;font-weight:700}
+.p2-bottom{display:grid;grid-template-columns:1fr 1fr;gap:16px;margin-top:20px}
+.p2-badge-box{background:#fff;border:3px solid #002F6C;border-radius:10px;padding:16px;text-align:center}
+.p2-badge-label{font-size:11px;font-weight:800;color:#002F6C;text-transform:uppercase}
+.p2-badge-value{font-size:18px;font-weight:900;color:#002F6C;margin-top:4px}
+
+/* PAGE 3: DETAILED MEASUREMENTS */
+.p3{background:#E0ECF5;min-height:11in;max-width:8.5in;margin:0 auto;padding:28px 32px}
+.p3-header{display:flex;justify-content:space-between;background:#002F6C;color:#fff;padding:18px 24px;border-radius:10px;margin-bottom:18px}
+.p3-header-title{font-size:22px;font-weight:900;text-transform:uppercase;line-height:1.1}
+.p3-header-meta{text-align:right;font-size:11px;color:#B0C4D8}
+.p3-header-meta b{color:#fff}
+.p3-content{display:grid;grid-template-columns:1fr 1fr;gap:16px;margin-bottom:16px}
+.p3-box{background:#fff;border-radius:8px;padding:16px 20px;box-shadow:0 1px 4px rgba(0,0,0,0.06)}
+.p3-box-title{font-size:12px;font-weight:800;color:#002F6C;text-transform:uppercase;letter-spacing:1px;margin-bottom:10px;padding-bottom:6px;border-bottom:2px solid #E0ECF5}
+.p3-facet{padding:5px 0;border-bottom:1px solid #F0F4F8;font-size:11px;color:#335C8A}
+.p3-facet:last-child{border-bottom:none}
+.p3-facet b{color:#002F6C}
+.p3-lin-row{display:flex;align-items:center;gap:8px;padding:6px 0;border-bottom:1px solid #F0F4F8;font-size:12px}
+.p3-lin-row:last-child{border-bottom:none}
+.p3-lin-color{width:16px;height:16px;border-radius:3px;flex-shrink:0}
+.p3-lin-label{flex:1;color:#335C8A}
+.p3-lin-value{font-weight:700;color:#002F6C;min-width:60px;text-align:right}
+.p3-pen-title{font-size:11px;font-weight:800;color:#002F6C;text-transform:uppercase;margin:14px 0 8px;padding-bottom:4px;border-bottom:2px solid #E0ECF5}
+.p3-pen-row{display:flex;justify-content:space-between;padding:4px 0;font-size:12px;color:#335C8A}
+.p3-pen-row b{color:#002F6C}
+
+@media print{
+  .p1,.p2,.p3{page-break-after:always;min-height:auto}
+  body,.p1{-webkit-print-color-adjust:exact;print-color-adjust:exact}
+}
+</style>
+</head>
+<body>
+"""
+
+
+# Page 3 linear-measurement legend: (swatch colour, label), in the same order
+# as the edge totals zipped with it in iter_html_report
+_HTML_LINEAR_ROWS = (
+    ("#E53935", "Ridge"),
+    ("#5B9BD5", "Hip"),
+    ("#43A047", "Valley"),
+    ("#FF9800", "Eaves"),
+    ("#9C27B0", "Rake"),
+)
+
+
+def _silent(*args, **kwargs):
+    """Progress sink for quiet mode: drop the message."""
 
 
 # ==============================================================================
@@ -1171,11 +1504,17 @@ class RoofingAnalysisEngine:
         report = engine.analyze(address="123 Main St, Edmonton, AB")
         engine.print_summary(report)
         engine.save_html_report(report, "report.html")
+        reports = engine.analyze_many(["123 Main St, ...", "456 Oak Ave, ..."])
     """
 
-    def __init__(self, api_key: Optional[str] = None, maps_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, maps_key: Optional[str] = None,
+                 session: Optional['requests.Session'] = None, verbose: bool = True):
         self.api_key = api_key
         self.maps_key = maps_key or api_key
+        # Print pipeline progress from analyze() (off for quiet/batch use)
+        self.verbose = verbose
+        # Keep-alive pool for every Google request this engine makes
+        self.session = session or _get_session()
 
     @classmethod
     def from_image(cls, image_path: str) -> 'RoofingAnalysisEngine':
@@ -1211,82 +1550,92 @@ class RoofingAnalysisEngine:
         if not self.api_key:
             raise ValueError("API key not set. Provide via constructor, OCR, or environment.")
 
+        log = print if self.verbose else _silent
+
         # Geocode if needed
         if lat is None or lng is None:
             if not address:
                 raise ValueError("Provide either address or lat/lng coordinates")
-            print(f"\n[1/10] Geocoding address: {address}")
-            coords = geocode_address(address, self.api_key)
+            log(f"\n[1/10] Geocoding address: {address}")
+            coords = geocode_address(address, self.api_key, session=self.session)
             if not coords:
                 raise RuntimeError(f"Failed to geocode address: {address}")
             lat, lng = coords
-            print(f"  -> ({lat}, {lng})")
+            log(f"  -> ({lat}, {lng})")
         else:
-            print(f"\n[1/10] Using coordinates: ({lat}, {lng})")
+            log(f"\n[1/10] Using coordinates: ({lat}, {lng})")
 
         # Call Solar API
-        print(f"[2/10] Calling Google Solar API (buildingInsights:findClosest)...")
+        log(f"[2/10] Calling Google Solar API (buildingInsights:findClosest)...")
         try:
-            solar_data = call_solar_api(lat, lng, self.api_key)
+            solar_data = call_solar_api(lat, lng, self.api_key, session=self.session)
             provider = "google_solar_api"
             api_duration = solar_data.get("_api_duration_ms", 0)
-            print(f"  -> Success ({api_duration:.0f} ms)")
+            log(f"  -> Success ({api_duration:.0f} ms)")
         except Exception as e:
-            print(f"  -> ERROR: {e}")
+            log(f"  -> ERROR: {e}")
             raise
 
         solar_potential = solar_data.get("solarPotential", {})
 
         # Parse segments
-        print("[3/10] Parsing roof segments...")
+        log("[3/10] Parsing roof segments...")
         segments = parse_solar_segments(solar_data)
-        print(f"  -> {len(segments)} segments detected")
+        log(f"  -> {len(segments)} segments detected")
 
         # Compute area totals
-        print("[4/10] Computing 3D surface areas...")
-        total_footprint_sqft = sum(s.footprint_area_sqft for s in segments)
-        total_true_area_sqft = sum(s.true_area_sqft for s in segments)
-        total_true_area_sqm = sum(s.true_area_sqm for s in segments)
+        log("[4/10] Computing 3D surface areas...")
+        # Area totals, the pitch-weighting numerator and the largest segment
+        # (dominant azimuth) in one pass over the segments
+        total_footprint_sqft = total_true_area_sqft = total_true_area_sqm = 0
+        pitch_area_sum = 0
+        largest_segment = None
+        for s in segments:
+            true_area = s.true_area_sqft
+            total_footprint_sqft += s.footprint_area_sqft
+            total_true_area_sqft += true_area
+            total_true_area_sqm += s.true_area_sqm
+            pitch_area_sum += s.pitch_degrees * true_area
+            if largest_segment is None or true_area > largest_segment.true_area_sqft:
+                largest_segment = s
         total_footprint_sqm = round(total_footprint_sqft * SQM_PER_SQFT)
 
         # Weighted pitch
         if total_true_area_sqft > 0:
-            weighted_pitch = sum(
-                s.pitch_degrees * s.true_area_sqft for s in segments
-            ) / total_true_area_sqft
+            weighted_pitch = pitch_area_sum / total_true_area_sqft
         else:
             weighted_pitch = 0
 
-        # Dominant azimuth (largest segment)
-        largest_segment = max(segments, key=lambda s: s.true_area_sqft) if segments else None
         area_multiplier = total_true_area_sqft / (total_footprint_sqft or 1)
 
-        print(f"  -> Footprint: {total_footprint_sqft:,.0f} sqft")
-        print(f"  -> True Area: {total_true_area_sqft:,.0f} sqft")
-        print(f"  -> Multiplier: {area_multiplier:.3f}x")
-        print(f"  -> Weighted Pitch: {weighted_pitch:.1f} deg ({pitch_to_ratio(weighted_pitch)})")
+        log(f"  -> Footprint: {total_footprint_sqft:,.0f} sqft")
+        log(f"  -> True Area: {total_true_area_sqft:,.0f} sqft")
+        log(f"  -> Multiplier: {area_multiplier:.3f}x")
+        log(f"  -> Weighted Pitch: {weighted_pitch:.1f} deg ({pitch_to_ratio(weighted_pitch)})")
 
         # Generate edges
-        print("[5/10] Generating edge measurements (3D)...")
+        log("[5/10] Generating edge measurements (3D)...")
         edges = generate_edges(segments, total_footprint_sqft)
         edge_summary = compute_edge_summary(edges)
-        print(f"  -> {len(edges)} edges | Total: {edge_summary.total_linear_ft} ft")
+        log(f"  -> {len(edges)} edges | Total: {edge_summary.total_linear_ft} ft")
 
         # Material estimate
-        print(f"[6/10] Computing Bill of Materials ({shingle_type})...")
-        materials = compute_material_estimate(total_true_area_sqft, edges, segments, shingle_type)
-        print(f"  -> {materials.gross_squares} squares | {materials.bundle_count} bundles")
-        print(f"  -> Total materials: ${materials.total_material_cost_cad:,.2f} CAD")
+        log(f"[6/10] Computing Bill of Materials ({shingle_type})...")
+        materials = compute_material_estimate(
+            total_true_area_sqft, edges, segments, shingle_type, edge_summary
+        )
+        log(f"  -> {materials.gross_squares} squares | {materials.bundle_count} bundles")
+        log(f"  -> Total materials: ${materials.total_material_cost_cad:,.2f} CAD")
 
         # Waste table
-        print("[7/10] Generating waste comparison table...")
+        log("[7/10] Generating waste comparison table...")
         waste_table = generate_waste_table(total_true_area_sqft)
 
         # RAS yield
-        print("[8/10] Computing RAS yield analysis...")
+        log("[8/10] Computing RAS yield analysis...")
         ras_yield = compute_ras_yield(segments, total_true_area_sqft, shingle_type)
-        print(f"  -> Recovery rate: {ras_yield.recovery_rate_pct}%")
-        print(f"  -> Market value: ${ras_yield.market_value_total_cad:.2f} CAD")
+        log(f"  -> Recovery rate: {ras_yield.recovery_rate_pct}%")
+        log(f"  -> Market value: ${ras_yield.market_value_total_cad:.2f} CAD")
 
         # Solar data
         max_sunshine = solar_potential.get("maxSunshineHoursPerYear", 0)
@@ -1314,14 +1663,15 @@ class RoofingAnalysisEngine:
 
         confidence = 90 if imagery_quality == "HIGH" else (75 if imagery_quality == "MEDIUM" else 60)
 
-        print("[9/10] Building imagery URLs...")
-        image_key = self.maps_key or self.api_key
-        satellite_url = f"https://maps.googleapis.com/maps/api/staticmap?center={lat},{lng}&zoom=20&size=600x400&maptype=satellite&key={image_key}"
-
-        def sv(heading):
-            return f"https://maps.googleapis.com/maps/api/streetview?size=600x400&location={lat},{lng}&heading={heading}&pitch=25&fov=90&key={image_key}"
+        log("[9/10] Building imagery URLs...")
+        image_key = quote_plus(self.maps_key or self.api_key)
+        satellite_url = STATIC_MAP_URL_TEMPLATE.format(lat=lat, lng=lng, key=image_key)
+        north_url, east_url, south_url, west_url = (
+            STREET_VIEW_URL_TEMPLATE.format(lat=lat, lng=lng, heading=heading, key=image_key)
+            for heading in (0, 90, 180, 270)
+        )
 
-        print("[10/10] Assembling report...")
+        log("[10/10] Assembling report...")
 
         # Parse address components if available
         city = ""
@@ -1335,9 +1685,9 @@ class RoofingAnalysisEngine:
             if len(parts) >= 3:
                 province = parts[-1].strip().split()[0] if parts[-1].strip() else ""
             # Extract postal code
-            pc_match = re.search(r'[A-Z]\d[A-Z]\s?\d[A-Z]\d', address.upper())
+            pc_match = POSTAL_CODE_RE.search(address)
             if pc_match:
-                postal_code = pc_match.group()
+                postal_code = pc_match.group().upper()
 
         report = RoofReport(
             generated_at=datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
@@ -1372,111 +1722,151 @@ class RoofingAnalysisEngine:
             provider=provider,
             api_duration_ms=api_duration,
             satellite_url=satellite_url,
-            north_url=sv(0),
-            south_url=sv(180),
-            east_url=sv(90),
-            west_url=sv(270),
+            north_url=north_url,
+            south_url=south_url,
+            east_url=east_url,
+            west_url=west_url,
         )
 
-        print("\n" + "=" * 60)
-        print("  ANALYSIS COMPLETE")
-        print("=" * 60)
+        log("\n" + "=" * 60)
+        log("  ANALYSIS COMPLETE")
+        log("=" * 60)
         return report
 
+    def analyze_many(
+        self,
+        addresses: List[str],
+        shingle_type: str = "architectural",
+        max_concurrency: int = 4
+    ) -> List[RoofReport]:
+        """
+        Analyze several addresses concurrently; reports come back in input order.
+
+        The pipeline is dominated by the Geocoding/Solar round trips, so up to
+        `max_concurrency` addresses are in flight at once over the shared
+        keep-alive session. Progress output from concurrent analyses may
+        interleave. The first failure is re-raised (like analyze()).
+        """
+        if not addresses:
+            return []
+        workers = max(1, min(max_concurrency, len(addresses)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(
+                lambda addr: self.analyze(address=addr, shingle_type=shingle_type),
+                addresses
+            ))
+
     # --------------------------------------------------------------------------
     # OUTPUT: Console Summary
     # --------------------------------------------------------------------------
 
     def print_summary(self, report: RoofReport):
         """Print a formatted console summary of the report."""
+        # One write per summary, so summaries from concurrent batch workers
+        # never interleave line by line
+        sys.stdout.write(self.format_summary(report))
+
+    def format_summary(self, report: RoofReport) -> str:
+        """The console summary of the report as one newline-terminated string."""
+        lines = []
+        out = lines.append
         W = 60
-        print("\n" + "=" * W)
-        print("  REUSE CANADA - PRO-GRADE ROOF MEASUREMENT REPORT v3.0")
-        print("=" * W)
-        print(f"  Property:   {report.address}")
-        print(f"  Coords:     ({report.latitude}, {report.longitude})")
-        print(f"  Generated:  {report.generated_at}")
-        print(f"  Provider:   {report.provider}")
-        print(f"  Quality:    {report.imagery_quality} | Confidence: {report.confidence_score}%")
-        print("-" * W)
+        out("\n" + "=" * W)
+        out("  REUSE CANADA - PRO-GRADE ROOF MEASUREMENT REPORT v3.0")
+        out("=" * W)
+        out(f"  Property:   {report.address}")
+        out(f"  Coords:     ({report.latitude}, {report.longitude})")
+        out(f"  Generated:  {report.generated_at}")
+        out(f"  Provider:   {report.provider}")
+        out(f"  Quality:    {report.imagery_quality} | Confidence: {report.confidence_score}%")
+        out("-" * W)
 
         # Area
-        print("\n  AREA MEASUREMENTS")
-        print(f"    Footprint (2D):  {report.total_footprint_sqft:>8,} sq ft  ({report.total_footprint_sqm:,} sq m)")
-        print(f"    True Area (3D):  {report.total_true_area_sqft:>8,} sq ft  ({report.total_true_area_sqm:,} sq m)")
-        print(f"    Multiplier:      {report.area_multiplier:>8.3f}x")
-        print(f"    Squares:         {report.total_true_area_sqft / 100:>8.1f}")
+        out("\n  AREA MEASUREMENTS")
+        out(f"    Footprint (2D):  {report.total_footprint_sqft:>8,} sq ft  ({report.total_footprint_sqm:,} sq m)")
+        out(f"    True Area (3D):  {report.total_true_area_sqft:>8,} sq ft  ({report.total_true_area_sqm:,} sq m)")
+        out(f"    Multiplier:      {report.area_multiplier:>8.3f}x")
+        out(f"    Squares:         {report.total_true_area_sqft / 100:>8.1f}")
 
         # Pitch
-        print(f"\n  PITCH & ORIENTATION")
-        print(f"    Weighted Pitch:  {report.roof_pitch_degrees} deg ({report.roof_pitch_ratio})")
-        print(f"    Primary Facing:  {report.roof_azimuth_degrees} deg ({degrees_to_cardinal(report.roof_azimuth_degrees)})")
+        out(f"\n  PITCH & ORIENTATION")
+        out(f"    Weighted Pitch:  {report.roof_pitch_degrees} deg ({report.roof_pitch_ratio})")
+        out(f"    Primary Facing:  {report.roof_azimuth_degrees} deg ({degrees_to_cardinal(report.roof_azimuth_degrees)})")
 
         # Segments
-        print(f"\n  ROOF SEGMENTS ({len(report.segments)})")
+        out(f"\n  ROOF SEGMENTS ({len(report.segments)})")
         for s in report.segments:
-            print(f"    {s.name:20s}  {s.true_area_sqft:>6,} sqft  Pitch: {s.pitch_ratio:8s}  Facing: {s.azimuth_direction}")
+            out(f"    {s.name:20s}  {s.true_area_sqft:>6,} sqft  Pitch: {s.pitch_ratio:8s}  Facing: {s.azimuth_direction}")
 
         # Edge Summary
         es = report.edge_summary
         if es:
-            print(f"\n  EDGE MEASUREMENTS (Total: {es.total_linear_ft} ft)")
-            print(f"    Ridge:  {es.total_ridge_ft:>6} ft")
-            print(f"    Hip:    {es.total_hip_ft:>6} ft")
-            print(f"    Valley: {es.total_valley_ft:>6} ft")
-            print(f"    Eave:   {es.total_eave_ft:>6} ft")
-            print(f"    Rake:   {es.total_rake_ft:>6} ft")
+            out(f"\n  EDGE MEASUREMENTS (Total: {es.total_linear_ft} ft)")
+            out(f"    Ridge:  {es.total_ridge_ft:>6} ft")
+            out(f"    Hip:    {es.total_hip_ft:>6} ft")
+            out(f"    Valley: {es.total_valley_ft:>6} ft")
+            out(f"    Eave:   {es.total_eave_ft:>6} ft")
+            out(f"    Rake:   {es.total_rake_ft:>6} ft")
 
         # Material BOM
         mat = report.materials
         if mat:
-            print(f"\n  BILL OF MATERIALS ({mat.shingle_type.upper()}, {mat.complexity_class.upper()} COMPLEXITY)")
-            print(f"    Waste Factor: {mat.waste_pct}% | Gross Squares: {mat.gross_squares}")
-            print(f"    {'Item':<35s} {'Qty':>8s} {'Unit':>10s} {'Cost (CAD)':>12s}")
-            print(f"    {'-'*35} {'-'*8} {'-'*10} {'-'*12}")
+            out(f"\n  BILL OF MATERIALS ({mat.shingle_type.upper()}, {mat.complexity_class.upper()} COMPLEXITY)")
+            out(f"    Waste Factor: {mat.waste_pct}% | Gross Squares: {mat.gross_squares}")
+            out(f"    {'Item':<35s} {'Qty':>8s} {'Unit':>10s} {'Cost (CAD)':>12s}")
+            out(f"    {'-'*35} {'-'*8} {'-'*10} {'-'*12}")
             for item in mat.line_items:
-                print(f"    {item.description:<35s} {item.order_quantity:>8.0f} {item.order_unit:>10s} ${item.line_total_cad:>10,.2f}")
-            print(f"    {'':35s} {'':>8s} {'TOTAL':>10s} ${mat.total_material_cost_cad:>10,.2f}")
+                out(f"    {item.description:<35s} {item.order_quantity:>8.0f} {item.order_unit:>10s} ${item.line_total_cad:>10,.2f}")
+            out(f"    {'':35s} {'':>8s} {'TOTAL':>10s} ${mat.total_material_cost_cad:>10,.2f}")
 
         # Waste Table
-        print(f"\n  WASTE COMPARISON TABLE")
-        print(f"    {'Waste %':>8s} {'Factor':>8s} {'Gross sqft':>12s} {'Squares':>10s} {'Bundles':>10s}")
+        out(f"\n  WASTE COMPARISON TABLE")
+        out(f"    {'Waste %':>8s} {'Factor':>8s} {'Gross sqft':>12s} {'Squares':>10s} {'Bundles':>10s}")
         for w in report.waste_table:
-            print(f"    {w['waste_pct']:>7d}% {w['factor']:>8.2f} {w['gross_sqft']:>12,} {w['squares']:>10.1f} {w['bundles']:>10d}")
+            out(f"    {w['waste_pct']:>7d}% {w['factor']:>8.2f} {w['gross_sqft']:>12,} {w['squares']:>10.1f} {w['bundles']:>10d}")
 
         # RAS Yield
         ras = report.ras_yield
         if ras:
-            print(f"\n  RAS YIELD ANALYSIS (Reuse Canada)")
-            print(f"    Total Weight:    {ras.estimated_weight_lbs:>8,} lbs")
-            print(f"    Binder Oil:      {ras.total_binder_oil_gallons:>8.1f} gal  (${ras.market_value_oil_cad:,.2f})")
-            print(f"    Granules:        {ras.total_granules_lbs:>8,} lbs  (${ras.market_value_granules_cad:,.2f})")
-            print(f"    Fiber:           {ras.total_fiber_lbs:>8,} lbs  (${ras.market_value_fiber_cad:,.2f})")
-            print(f"    Recovery Rate:   {ras.recovery_rate_pct}%")
-            print(f"    Market Value:    ${ras.market_value_total_cad:>8,.2f} CAD")
-            print(f"    Recommendation:  {ras.processing_recommendation[:80]}")
+            out(f"\n  RAS YIELD ANALYSIS (Reuse Canada)")
+            out(f"    Total Weight:    {ras.estimated_weight_lbs:>8,} lbs")
+            out(f"    Binder Oil:      {ras.total_binder_oil_gallons:>8.1f} gal  (${ras.market_value_oil_cad:,.2f})")
+            out(f"    Granules:        {ras.total_granules_lbs:>8,} lbs  (${ras.market_value_granules_cad:,.2f})")
+            out(f"    Fiber:           {ras.total_fiber_lbs:>8,} lbs  (${ras.market_value_fiber_cad:,.2f})")
+            out(f"    Recovery Rate:   {ras.recovery_rate_pct}%")
+            out(f"    Market Value:    ${ras.market_value_total_cad:>8,.2f} CAD")
+            out(f"    Recommendation:  {ras.processing_recommendation[:80]}")
 
         # Solar
-        print(f"\n  SOLAR POTENTIAL")
-        print(f"    Max Sunshine:    {report.max_sunshine_hours:,.1f} hrs/year")
-        print(f"    Panel Capacity:  {report.num_panels_possible} panels")
-        print(f"    Energy Yield:    {report.yearly_energy_kwh:,.0f} kWh/year")
-
-        print("\n" + "=" * W)
-        print(f"  Accuracy: {report.accuracy_benchmark}")
-        print(f"  Cost: {report.cost_per_query}")
+        out(f"\n  SOLAR POTENTIAL")
+        out(f"    Max Sunshine:    {report.max_sunshine_hours:,.1f} hrs/year")
+        out(f"    Panel Capacity:  {report.num_panels_possible} panels")
+        out(f"    Energy Yield:    {report.yearly_energy_kwh:,.0f} kWh/year")
+
+        out("\n" + "=" * W)
+        out(f"  Accuracy: {report.accuracy_benchmark}")
+        out(f"  Cost: {report.cost_per_query}")
         if report.quality_notes:
             for note in report.quality_notes:
-                print(f"  NOTE: {note}")
-        print("=" * W)
+                out(f"  NOTE: {note}")
+        out("=" * W)
+        return "\n".join(lines) + "\n"
 
     # --------------------------------------------------------------------------
     # OUTPUT: JSON
     # --------------------------------------------------------------------------
 
     def to_json(self, report: RoofReport) -> str:
-        """Serialize the report to JSON."""
-        return json.dumps(asdict(report), indent=2, default=str)
+        """Serialize the report to JSON (orjson when installed, else stdlib json)."""
+        if orjson is not None:
+            return self._json_bytes(report).decode("utf-8")
+        # orjson never \u-escapes non-ASCII (e.g. Québec addresses); match it
+        return json.dumps(report.to_dict(), indent=2, default=str, ensure_ascii=False)
+
+    def _json_bytes(self, report: RoofReport) -> bytes:
+        """The to_json() document as UTF-8 bytes, via orjson (callers check it is installed)."""
+        # orjson serializes (slotted) dataclasses natively, no to_dict() pass
+        return orjson.dumps(report, default=str, option=orjson.OPT_INDENT_2)
 
     # --------------------------------------------------------------------------
     # OUTPUT: Professional 3-Page HTML Report
@@ -1494,118 +1884,70 @@ class RoofingAnalysisEngine:
         The output is print-ready (page-break-after), PDF-convertible,
         and email-embeddable.
         """
-        now = datetime.now(timezone.utc)
-        report_num = f"RM-{now.strftime('%Y%m%d')}-{str(report.order_id).zfill(4)}"
-        report_date = now.strftime("%B %d, %Y")
-        full_address = ", ".join(filter(None, [report.address, report.city, report.province, report.postal_code]))
+        return "".join(self.iter_html_report(report))
+
+    def write_html_report(self, report: RoofReport, fileobj):
+        """Write the HTML report to an open text file piece by piece."""
+        fileobj.writelines(self.iter_html_report(report))
+
+    def iter_html_report(self, report: RoofReport) -> Iterator[str]:
+        """
+        Yield the HTML report as consecutive string pieces (dynamic head,
+        static stylesheet, each page split around its facet/waste rows, one
+        piece per row). Pieces are built only as they are consumed, so a
+        writer never holds the whole report in memory.
+        """
+        # Date the report from its own generated_at stamp so the HTML and JSON
+        # agree (and no second clock read); fall back to now if it is missing
+        try:
+            now = datetime.fromisoformat(report.generated_at.replace('Z', '+00:00'))
+        except ValueError:
+            now = datetime.now(timezone.utc)
+        report_num = f"RM-{now:%Y%m%d}-{str(report.order_id).zfill(4)}"
+        report_date = f"{now:%B %d, %Y}"
+        # Address text is user/API supplied: escape it for the HTML body
+        full_address = escape(", ".join(filter(None, [report.address, report.city, report.province, report.postal_code])))
 
         mat = report.materials
         es = report.edge_summary
         net_squares = round(report.total_true_area_sqft / 100 * 10) / 10
         gross_squares = mat.gross_squares if mat else net_squares
-        total_drip_edge = (es.total_eave_ft + es.total_rake_ft) if es else 0
-        starter_strip_ft = es.total_eave_ft if es else 0
-        ridge_hip_ft = (es.total_ridge_ft + es.total_hip_ft) if es else 0
+        # Values shown more than once are looked up and formatted once
+        waste_pct = mat.waste_pct if mat else 10
+        material_cost = f"{mat.total_material_cost_cad:,.2f}"
+        total_area = f"{report.total_true_area_sqft:,}"
+        gross_squares_whole = round(gross_squares)
+        if es:
+            ridge_ft, hip_ft, valley_ft = es.total_ridge_ft, es.total_hip_ft, es.total_valley_ft
+            eave_ft, rake_ft = es.total_eave_ft, es.total_rake_ft
+        else:
+            ridge_ft = hip_ft = valley_ft = eave_ft = rake_ft = 0
+        total_drip_edge = eave_ft + rake_ft
+        starter_strip_ft = eave_ft
+        ridge_hip_ft = ridge_ft + hip_ft
         pipe_boots = max(2, len(report.segments) // 2)
         chimneys = 1 if len(report.segments) >= 6 else 0
         exhaust_vents = max(1, len(report.segments) // 3)
-        nail_lbs = math.ceil(gross_squares * 1.5)
-        cement_tubes = max(2, math.ceil(gross_squares / 15))
-
-        # Facet data for diagram
-        seg_rows = ""
-        for i, s in enumerate(report.segments):
-            seg_rows += f'<div class="p3-facet"><b>Facet {i+1}:</b> {s.true_area_sqft:,} sq ft | Pitch: {s.pitch_ratio}</div>\n'
-
-        # Waste table rows
-        waste_rows = ""
-        for w in report.waste_table:
-            waste_rows += f"""<div class="p2-row">
-              <span class="p2-row-label">{w['waste_pct']}% Waste ({w['description']})</span>
-              <span class="p2-row-value">{w['gross_sqft']:,} sqft = {w['squares']:.1f} squares ({w['bundles']} bundles)</span>
-            </div>\n"""
+        # Squares are reported to 0.1, so size in whole tenths with integer
+        # ceil-div: ceil(squares * 1.5) lbs of nails, a tube per 15 squares
+        gross_tenths = round(gross_squares * 10)
+        nail_lbs = _ceildiv(gross_tenths * 3, 20)
+        cement_tubes = max(2, _ceildiv(gross_tenths, 150))
+        linear_rows = "\n".join(
+            f'      <div class="p3-lin-row"><div class="p3-lin-color" style="background:{color}"></div>'
+            f'<div class="p3-lin-label">{label}:</div><div class="p3-lin-value">{ft} ft</div></div>'
+            for (color, label), ft in zip(_HTML_LINEAR_ROWS, (ridge_ft, hip_ft, valley_ft, eave_ft, rake_ft))
+        )
 
-        return f"""<!DOCTYPE html>
+        yield f"""<!DOCTYPE html>
 <html lang="en">
 <head>
 <meta charset="UTF-8">
 <meta name="viewport" content="width=device-width, initial-scale=1.0">
-<title>Roof Measurement Report - {report.address}</title>
-<style>
-@import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800;900&display=swap');
-*{{margin:0;padding:0;box-sizing:border-box}}
-body{{font-family:'Inter',system-ui,sans-serif;background:#fff;color:#1a1a2e;font-size:10pt;line-height:1.4}}
-@media print{{.page{{page-break-after:always}}.page:last-child{{page-break-after:auto}}}}
-
-/* PAGE 1: DARK DASHBOARD */
-.p1{{background:linear-gradient(180deg,#0B1E2F 0%,#0F2740 50%,#0B1E2F 100%);color:#fff;min-height:11in;max-width:8.5in;margin:0 auto;padding:28px 32px;position:relative}}
-.p1-header{{display:flex;justify-content:space-between;align-items:flex-start;margin-bottom:18px}}
-.p1-logo-icon{{width:48px;height:48px;background:linear-gradient(135deg,#00E5FF,#0091EA);border-radius:10px;display:inline-flex;align-items:center;justify-content:center;font-size:20px;font-weight:900;color:#0B1E2F}}
-.p1-rn{{color:#00E5FF;font-size:13px;font-weight:700}}
-.p1-date{{color:#8ECAE6;font-size:11px}}
-.p1-addr{{color:#B0C4D8;font-size:12px;padding:8px 14px;background:rgba(255,255,255,0.04);border:1px solid rgba(0,229,255,0.15);border-radius:8px;margin-bottom:16px}}
-.p1-section-label{{color:#00E5FF;font-size:10px;font-weight:700;text-transform:uppercase;letter-spacing:2px;text-align:center;margin:12px 0 8px}}
-.p1-card{{background:rgba(255,255,255,0.04);border:1px solid rgba(0,229,255,0.15);border-radius:10px;padding:14px 16px}}
-.p1-card-accent{{border-color:rgba(0,229,255,0.5);background:rgba(0,229,255,0.06)}}
-.p1-card-label{{color:#8ECAE6;font-size:8px;font-weight:700;text-transform:uppercase;letter-spacing:1.5px;margin-bottom:4px}}
-.p1-card-value{{font-size:28px;font-weight:900;color:#00E5FF;line-height:1}}
-.p1-unit{{font-size:14px;color:#8ECAE6;margin-left:4px}}
-.p1-tag{{display:inline-block;padding:2px 10px;background:rgba(0,229,255,0.12);border:1px solid rgba(0,229,255,0.3);border-radius:20px;font-size:12px;font-weight:600;color:#00E5FF;margin-right:6px}}
-.p1-squares{{background:linear-gradient(135deg,rgba(0,229,255,0.15),rgba(0,229,255,0.05));border:2px solid rgba(0,229,255,0.4);border-radius:12px;padding:14px 20px;text-align:center}}
-.p1-sq-num{{font-size:42px;font-weight:900;color:#00E5FF}}
-.p1-sq-label{{font-size:11px;font-weight:700;text-transform:uppercase;letter-spacing:2px;color:#8ECAE6}}
-.p1-lin-item{{color:#B0C4D8;font-size:11px;display:inline-block;margin-right:16px}}
-.p1-lin-item b{{color:#fff;font-weight:700;font-size:13px}}
-.p1-badge{{padding:4px 12px;border-radius:20px;font-size:9px;font-weight:600;display:inline-block;margin:2px 4px}}
-.p1-badge-high{{background:rgba(0,229,255,0.15);color:#00E5FF;border:1px solid rgba(0,229,255,0.3)}}
-.p1-badge-provider{{background:rgba(255,255,255,0.05);color:#8ECAE6;border:1px solid rgba(255,255,255,0.1)}}
-.p1-footer{{text-align:center;margin-top:12px;padding-top:10px;border-top:1px solid rgba(0,229,255,0.1);color:#5A7A96;font-size:8px}}
-
-/* PAGE 2: MATERIAL ORDER (Light) */
-.p2{{background:#E8F4FD;min-height:11in;max-width:8.5in;margin:0 auto;padding:32px 36px}}
-.p2-title{{font-size:24px;font-weight:900;color:#002F6C;text-align:center;text-transform:uppercase}}
-.p2-subtitle{{text-align:center;color:#335C8A;font-size:12px;margin-top:4px}}
-.p2-ref{{text-align:center;color:#0077CC;font-size:11px;font-weight:600;margin:2px 0 24px}}
-.p2-section{{background:#fff;border-radius:8px;padding:18px 22px;margin-bottom:16px;border-left:4px solid #002F6C;box-shadow:0 1px 4px rgba(0,0,0,0.06)}}
-.p2-section-title{{font-size:13px;font-weight:800;color:#002F6C;text-transform:uppercase;letter-spacing:1px;margin-bottom:12px;padding-bottom:6px;border-bottom:2px solid #E0ECF5}}
-.p2-row{{display:flex;justify-content:space-between;align-items:center;padding:6px 0;border-bottom:1px solid #F0F4F8}}
-.p2-row:last-child{{border-bottom:none}}
-.p2-row-label{{color:#335C8A;font-size:12px}}
-.p2-row-value{{color:#002F6C;font-size:13px;font-weight:700}}
-.p2-bottom{{display:grid;grid-template-columns:1fr 1fr;gap:16px;margin-top:20px}}
-.p2-badge-box{{background:#fff;border:3px solid #002F6C;border-radius:10px;padding:16px;text-align:center}}
-.p2-badge-label{{font-size:11px;font-weight:800;color:#002F6C;text-transform:uppercase}}
-.p2-badge-value{{font-size:18px;font-weight:900;color:#002F6C;margin-top:4px}}
-
-/* PAGE 3: DETAILED MEASUREMENTS */
-.p3{{background:#E0ECF5;min-height:11in;max-width:8.5in;margin:0 auto;padding:28px 32px}}
-.p3-header{{display:flex;justify-content:space-between;background:#002F6C;color:#fff;padding:18px 24px;border-radius:10px;margin-bottom:18px}}
-.p3-header-title{{font-size:22px;font-weight:900;text-transform:uppercase;line-height:1.1}}
-.p3-header-meta{{text-align:right;font-size:11px;color:#B0C4D8}}
-.p3-header-meta b{{color:#fff}}
-.p3-content{{display:grid;grid-template-columns:1fr 1fr;gap:16px;margin-bottom:16px}}
-.p3-box{{background:#fff;border-radius:8px;padding:16px 20px;box-shadow:0 1px 4px rgba(0,0,0,0.06)}}
-.p3-box-title{{font-size:12px;font-weight:800;color:#002F6C;text-transform:uppercase;letter-spacing:1px;margin-bottom:10px;padding-bottom:6px;border-bottom:2px solid #E0ECF5}}
-.p3-facet{{padding:5px 0;border-bottom:1px solid #F0F4F8;font-size:11px;color:#335C8A}}
-.p3-facet:last-child{{border-bottom:none}}
-.p3-facet b{{color:#002F6C}}
-.p3-lin-row{{display:flex;align-items:center;gap:8px;padding:6px 0;border-bottom:1px solid #F0F4F8;font-size:12px}}
-.p3-lin-row:last-child{{border-bottom:none}}
-.p3-lin-color{{width:16px;height:16px;border-radius:3px;flex-shrink:0}}
-.p3-lin-label{{flex:1;color:#335C8A}}
-.p3-lin-value{{font-weight:700;color:#002F6C;min-width:60px;text-align:right}}
-.p3-pen-title{{font-size:11px;font-weight:800;color:#002F6C;text-transform:uppercase;margin:14px 0 8px;padding-bottom:4px;border-bottom:2px solid #E0ECF5}}
-.p3-pen-row{{display:flex;justify-content:space-between;padding:4px 0;font-size:12px;color:#335C8A}}
-.p3-pen-row b{{color:#002F6C}}
-
-@media print{{
-  .p1,.p2,.p3{{page-break-after:always;min-height:auto}}
-  body,.p1{{-webkit-print-color-adjust:exact;print-color-adjust:exact}}
-}}
-</style>
-</head>
-<body>
-
+<title>Roof Measurement Report - {escape(report.address)}</title>
+"""
+        yield _HTML_REPORT_HEAD_TAIL
+        yield f"""
 <!-- ==================== PAGE 1: ROOF MEASUREMENT DASHBOARD ==================== -->
 <div class="page p1">
   <div class="p1-header">
@@ -1651,25 +1993,25 @@ body{{font-family:'Inter',system-ui,sans-serif;background:#fff;color:#1a1a2e;fon
   <div style="display:grid;grid-template-columns:1.2fr 1fr 0.8fr;gap:10px;margin-bottom:10px">
     <div class="p1-card p1-card-accent">
       <div class="p1-card-label">TOTAL AREA</div>
-      <div class="p1-card-value">{report.total_true_area_sqft:,}<span class="p1-unit">sq ft</span></div>
+      <div class="p1-card-value">{total_area}<span class="p1-unit">sq ft</span></div>
     </div>
     <div class="p1-card">
       <div><span class="p1-tag">PITCH: {report.roof_pitch_ratio}</span><span class="p1-tag">{len(report.segments)} FACETS</span></div>
-      <div style="margin-top:6px"><span class="p1-tag">WASTE: {mat.waste_pct if mat else 10}%</span></div>
+      <div style="margin-top:6px"><span class="p1-tag">WASTE: {waste_pct}%</span></div>
     </div>
     <div class="p1-squares">
-      <div class="p1-sq-num">{round(gross_squares)}</div>
+      <div class="p1-sq-num">{gross_squares_whole}</div>
       <div class="p1-sq-label">SQUARES</div>
     </div>
   </div>
 
   <div class="p1-section-label">LINEAR MEASUREMENTS</div>
   <div style="padding:10px 16px;background:rgba(255,255,255,0.03);border:1px solid rgba(0,229,255,0.12);border-radius:8px;margin-bottom:14px">
-    <span class="p1-lin-item">RIDGE: <b>{es.total_ridge_ft if es else 0} ft</b></span>
-    <span class="p1-lin-item">HIP: <b>{es.total_hip_ft if es else 0} ft</b></span>
-    <span class="p1-lin-item">VALLEY: <b>{es.total_valley_ft if es else 0} ft</b></span>
-    <span class="p1-lin-item">EAVES: <b>{es.total_eave_ft if es else 0} ft</b></span>
-    <span class="p1-lin-item">RAKE: <b>{es.total_rake_ft if es else 0} ft</b></span>
+    <span class="p1-lin-item">RIDGE: <b>{ridge_ft} ft</b></span>
+    <span class="p1-lin-item">HIP: <b>{hip_ft} ft</b></span>
+    <span class="p1-lin-item">VALLEY: <b>{valley_ft} ft</b></span>
+    <span class="p1-lin-item">EAVES: <b>{eave_ft} ft</b></span>
+    <span class="p1-lin-item">RAKE: <b>{rake_ft} ft</b></span>
   </div>
 
   <div style="text-align:center;margin-top:10px">
@@ -1679,7 +2021,8 @@ body{{font-family:'Inter',system-ui,sans-serif;background:#fff;color:#1a1a2e;fon
   </div>
   <div class="p1-footer">Reuse Canada | Professional Roof Measurement Services | {report_num}</div>
 </div>
-
+"""
+        yield f"""
 <!-- ==================== PAGE 2: MATERIAL ORDER CALCULATION ==================== -->
 <div class="page p2">
   <div class="p2-title">MATERIAL ORDER CALCULATION</div>
@@ -1688,22 +2031,22 @@ body{{font-family:'Inter',system-ui,sans-serif;background:#fff;color:#1a1a2e;fon
 
   <div class="p2-section">
     <div class="p2-section-title">PRIMARY ROOFING MATERIALS</div>
-    <div class="p2-row"><span class="p2-row-label">Shingles</span><span class="p2-row-value">{round(net_squares)} squares + {mat.waste_pct if mat else 10}% waste = {round(gross_squares)} squares</span></div>
-    <div class="p2-row"><span class="p2-row-label">Underlayment</span><span class="p2-row-value">{report.total_true_area_sqft:,} sq ft</span></div>
+    <div class="p2-row"><span class="p2-row-label">Shingles</span><span class="p2-row-value">{round(net_squares)} squares + {waste_pct}% waste = {gross_squares_whole} squares</span></div>
+    <div class="p2-row"><span class="p2-row-label">Underlayment</span><span class="p2-row-value">{total_area} sq ft</span></div>
     <div class="p2-row"><span class="p2-row-label">Starter Strip</span><span class="p2-row-value">{starter_strip_ft} ft</span></div>
   </div>
 
   <div class="p2-section">
     <div class="p2-section-title">ACCESSORIES</div>
-    <div class="p2-row"><span class="p2-row-label">Ridge Cap</span><span class="p2-row-value">{es.total_ridge_ft if es else 0} ft</span></div>
+    <div class="p2-row"><span class="p2-row-label">Ridge Cap</span><span class="p2-row-value">{ridge_ft} ft</span></div>
     <div class="p2-row"><span class="p2-row-label">Hip & Ridge Shingles</span><span class="p2-row-value">{ridge_hip_ft} ft</span></div>
     <div class="p2-row"><span class="p2-row-label">Drip Edge</span><span class="p2-row-value">{total_drip_edge} ft</span></div>
-    <div class="p2-row"><span class="p2-row-label">Valley Metal</span><span class="p2-row-value">{es.total_valley_ft if es else 0} ft</span></div>
+    <div class="p2-row"><span class="p2-row-label">Valley Metal</span><span class="p2-row-value">{valley_ft} ft</span></div>
   </div>
 
   <div class="p2-section">
     <div class="p2-section-title">VENTILATION & FASTENERS</div>
-    <div class="p2-row"><span class="p2-row-label">Ridge Vent</span><span class="p2-row-value">{es.total_ridge_ft if es else 0} ft</span></div>
+    <div class="p2-row"><span class="p2-row-label">Ridge Vent</span><span class="p2-row-value">{ridge_ft} ft</span></div>
     <div class="p2-row"><span class="p2-row-label">Pipe Boots</span><span class="p2-row-value">{pipe_boots}</span></div>
     <div class="p2-row"><span class="p2-row-label">Roofing Nails</span><span class="p2-row-value">{nail_lbs} lbs</span></div>
     <div class="p2-row"><span class="p2-row-label">Roof Cement</span><span class="p2-row-value">{cement_tubes} tubes</span></div>
@@ -1711,22 +2054,30 @@ body{{font-family:'Inter',system-ui,sans-serif;background:#fff;color:#1a1a2e;fon
 
   <div class="p2-section">
     <div class="p2-section-title">WASTE COMPARISON TABLE</div>
-    {waste_rows}
+    """
+        # Waste table rows
+        for w in report.waste_table:
+            yield f"""<div class="p2-row">
+              <span class="p2-row-label">{w['waste_pct']}% Waste ({w['description']})</span>
+              <span class="p2-row-value">{w['gross_sqft']:,} sqft = {w['squares']:.1f} squares ({w['bundles']} bundles)</span>
+            </div>\n"""
+        yield f"""
   </div>
 
   <div class="p2-bottom">
     <div class="p2-badge-box">
       <div class="p2-badge-label">WASTE FACTOR</div>
-      <div class="p2-badge-value">{mat.waste_pct if mat else 10}%</div>
+      <div class="p2-badge-value">{waste_pct}%</div>
     </div>
     <div class="p2-badge-box">
       <div class="p2-badge-label">TOTAL MATERIAL COST</div>
-      <div class="p2-badge-value">${mat.total_material_cost_cad:,.2f} CAD</div>
+      <div class="p2-badge-value">${material_cost} CAD</div>
     </div>
   </div>
   <div style="text-align:center;margin-top:16px;color:#5A7A96;font-size:8px">Reuse Canada | Material Order Calculation | {report_num}</div>
 </div>
-
+"""
+        yield f"""
 <!-- ==================== PAGE 3: DETAILED MEASUREMENTS ==================== -->
 <div class="page p3">
   <div class="p3-header">
@@ -1741,15 +2092,15 @@ body{{font-family:'Inter',system-ui,sans-serif;background:#fff;color:#1a1a2e;fon
   <div class="p3-content">
     <div class="p3-box">
       <div class="p3-box-title">FACET BREAKDOWN</div>
-      {seg_rows}
+      """
+        # Facet data for diagram
+        for i, s in enumerate(report.segments):
+            yield f'<div class="p3-facet"><b>Facet {i+1}:</b> {s.true_area_sqft:,} sq ft | Pitch: {s.pitch_ratio}</div>\n'
+        yield f"""
     </div>
     <div class="p3-box">
       <div class="p3-box-title">LINEAR MEASUREMENTS</div>
-      <div class="p3-lin-row"><div class="p3-lin-color" style="background:#E53935"></div><div class="p3-lin-label">Ridge:</div><div class="p3-lin-value">{es.total_ridge_ft if es else 0} ft</div></div>
-      <div class="p3-lin-row"><div class="p3-lin-color" style="background:#5B9BD5"></div><div class="p3-lin-label">Hip:</div><div class="p3-lin-value">{es.total_hip_ft if es else 0} ft</div></div>
-      <div class="p3-lin-row"><div class="p3-lin-color" style="background:#43A047"></div><div class="p3-lin-label">Valley:</div><div class="p3-lin-value">{es.total_valley_ft if es else 0} ft</div></div>
-      <div class="p3-lin-row"><div class="p3-lin-color" style="background:#FF9800"></div><div class="p3-lin-label">Eaves:</div><div class="p3-lin-value">{es.total_eave_ft if es else 0} ft</div></div>
-      <div class="p3-lin-row"><div class="p3-lin-color" style="background:#9C27B0"></div><div class="p3-lin-label">Rake:</div><div class="p3-lin-value">{es.total_rake_ft if es else 0} ft</div></div>
+{linear_rows}
 
       <div class="p3-pen-title">PENETRATIONS</div>
       <div class="p3-pen-row"><span>Pipe Boots:</span><b>{pipe_boots}</b></div>
@@ -1763,7 +2114,7 @@ body{{font-family:'Inter',system-ui,sans-serif;background:#fff;color:#1a1a2e;fon
     <div style="display:grid;grid-template-columns:repeat(3,1fr);gap:10px">
       <div style="text-align:center;padding:8px;background:#EFF6FF;border-radius:6px">
         <div style="font-size:8px;color:#475569;text-transform:uppercase">Total Area</div>
-        <div style="font-size:16px;font-weight:800;color:#1D4ED8">{report.total_true_area_sqft:,} ft2</div>
+        <div style="font-size:16px;font-weight:800;color:#1D4ED8">{total_area} ft2</div>
       </div>
       <div style="text-align:center;padding:8px;background:#EFF6FF;border-radius:6px">
         <div style="font-size:8px;color:#475569;text-transform:uppercase">Roofing Squares</div>
@@ -1771,7 +2122,7 @@ body{{font-family:'Inter',system-ui,sans-serif;background:#fff;color:#1a1a2e;fon
       </div>
       <div style="text-align:center;padding:8px;background:#EFF6FF;border-radius:6px">
         <div style="font-size:8px;color:#475569;text-transform:uppercase">Material Cost</div>
-        <div style="font-size:16px;font-weight:800;color:#1D4ED8">${mat.total_material_cost_cad:,.2f}</div>
+        <div style="font-size:16px;font-weight:800;color:#1D4ED8">${material_cost}</div>
       </div>
     </div>
   </div>
@@ -1785,16 +2136,36 @@ body{{font-family:'Inter',system-ui,sans-serif;background:#fff;color:#1a1a2e;fon
 
     def save_html_report(self, report: RoofReport, output_path: str):
         """Generate and save the HTML report to a file."""
-        html = self.generate_html_report(report)
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(html)
+        pieces = self.iter_html_report(report)
+        # The first piece runs all per-report setup, so a bad report fails
+        # before the target file is opened (and truncated)
+        first = next(pieces)
+        try:
+            with open(output_path, "w", encoding="utf-8", buffering=OUTPUT_BUFFER_SIZE) as f:
+                f.write(first)
+                f.writelines(pieces)
+        except BaseException:
+            # Never leave a half-written report behind
+            try:
+                os.remove(output_path)
+            except OSError:
+                pass
+            raise
         print(f"\n[HTML] Report saved to: {output_path}")
         print(f"  Open in browser and print to PDF for professional output.")
 
     def save_json(self, report: RoofReport, output_path: str):
         """Save the report as JSON."""
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(self.to_json(report))
+        if orjson is not None:
+            # orjson already produces UTF-8 bytes: write them without a decode/encode round-trip
+            with open(output_path, "wb", buffering=OUTPUT_BUFFER_SIZE) as f:
+                f.write(self._json_bytes(report))
+        else:
+            # Stream the encoder's chunks into the buffered file instead of
+            # building the whole document as one string first (same options
+            # as to_json, so the file matches it exactly)
+            with open(output_path, "w", encoding="utf-8", buffering=OUTPUT_BUFFER_SIZE) as f:
+                json.dump(report.to_dict(), f, indent=2, default=str, ensure_ascii=False)
         print(f"\n[JSON] Report saved to: {output_path}")
 
 
@@ -1802,6 +2173,44 @@ body{{font-family:'Inter',system-ui,sans-serif;background:#fff;color:#1a1a2e;fon
 # CLI ENTRY POINT
 # ==============================================================================
 
+def _batch_report_names(addresses: List[str]) -> List[str]:
+    """
+    File name stem for each batch address: the address with non-alphanumerics
+    replaced by '_', cut to 50 chars. Stems that would collide get a _2, _3, ...
+    suffix so concurrent workers never write the same file.
+    """
+    names = []
+    taken = set()
+    for addr in addresses:
+        stem = name = SAFE_NAME_RE.sub('_', addr)[:50]
+        n = 1
+        while name in taken:
+            n += 1
+            name = f"{stem}_{n}"
+        taken.add(name)
+        names.append(name)
+    return names
+
+
+def _process_batch_address(engine: RoofingAnalysisEngine, args: argparse.Namespace,
+                           index: int, total: int, addr: str, base_path: str):
+    """Analyze one batch address and save its JSON and HTML reports (worker body)."""
+    print(f"\n--- [{index}/{total}] {addr} ---")
+    try:
+        report = engine.analyze(address=addr, shingle_type=args.shingle_type)
+        engine.print_summary(report)
+
+        # Save individual reports
+        if not args.no_html:
+            engine.save_html_report(report, base_path + ".html")
+
+        engine.save_json(report, base_path + ".json")
+
+    except Exception as e:
+        # Workers run concurrently: name the address so the error is traceable
+        print(f"  ERROR [{index}/{total}] {addr}: {e}")
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Reuse Canada - Pro-Grade Roofing Analysis Engine v3.0",
@@ -1841,23 +2250,36 @@ Examples:
     parser.add_argument("--json", type=str, help="Save full JSON report to file")
     parser.add_argument("--batch", type=str, help="Process multiple addresses from file (one per line)")
     parser.add_argument("--output-dir", type=str, default=".", help="Output directory for batch reports")
+    parser.add_argument("--no-html", action="store_true",
+                        help="Batch mode: save only the JSON report per address (skip HTML)")
+    parser.add_argument("--workers", type=int, default=8,
+                        help="Concurrent addresses in batch mode (default: 8, use 1 for serial)")
     parser.add_argument("--compare", action="store_true", help="Show Manual vs Automated comparison table")
+    parser.add_argument("--no-cache", action="store_true",
+                        help=f"Always call the Google APIs (skip the response cache in {CACHE_DIR})")
     parser.add_argument("--quiet", action="store_true", help="Suppress progress output")
 
     args = parser.parse_args()
 
+    if args.no_cache:
+        _API_CACHE.enabled = False
+
     # Show comparison table
     if args.compare:
-        table = generate_comparison_table()
         W = 90
-        print("\n" + "=" * W)
-        print("  MANUAL vs AUTOMATED ROOF INSPECTION COMPARISON")
-        print("=" * W)
-        print(f"  {'Metric':<25s} {'Manual':<30s} {'Automated':<30s}")
-        print(f"  {'-'*25} {'-'*30} {'-'*30}")
-        for row in table:
-            print(f"  {row['metric']:<25s} {row['manual']:<30s} {row['automated']:<30s}")
-        print("=" * W)
+        lines = [
+            "\n" + "=" * W,
+            "  MANUAL vs AUTOMATED ROOF INSPECTION COMPARISON",
+            "=" * W,
+            f"  {'Metric':<25s} {'Manual':<30s} {'Automated':<30s}",
+            f"  {'-'*25} {'-'*30} {'-'*30}",
+        ]
+        lines.extend(
+            f"  {row['metric']:<25s} {row['manual']:<30s} {row['automated']:<30s}"
+            for row in COMPARISON_TABLE
+        )
+        lines.append("=" * W)
+        sys.stdout.write("\n".join(lines) + "\n")
         return
 
     # Determine API key
@@ -1878,7 +2300,7 @@ Examples:
         sys.exit(1)
 
     maps_key = args.maps_key or api_key
-    engine = RoofingAnalysisEngine(api_key=api_key, maps_key=maps_key)
+    engine = RoofingAnalysisEngine(api_key=api_key, maps_key=maps_key, verbose=not args.quiet)
 
     # Batch mode
     if args.batch:
@@ -1888,27 +2310,27 @@ Examples:
 
         os.makedirs(args.output_dir, exist_ok=True)
 
-        with open(args.batch, "r") as f:
-            addresses = [line.strip() for line in f if line.strip() and not line.startswith("#")]
-
-        print(f"\n[BATCH] Processing {len(addresses)} addresses...")
-        for i, addr in enumerate(addresses):
-            print(f"\n--- [{i+1}/{len(addresses)}] {addr} ---")
-            try:
-                report = engine.analyze(address=addr, shingle_type=args.shingle_type)
-                engine.print_summary(report)
-
-                # Save individual reports
-                safe_name = re.sub(r'[^a-zA-Z0-9]', '_', addr)[:50]
-                if args.html or True:  # Always save HTML in batch mode
-                    html_path = os.path.join(args.output_dir, f"{safe_name}.html")
-                    engine.save_html_report(report, html_path)
-
-                json_path = os.path.join(args.output_dir, f"{safe_name}.json")
-                engine.save_json(report, json_path)
-
-            except Exception as e:
-                print(f"  ERROR: {e}")
+        with open(args.batch, "r", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        addresses = [line for line in map(str.strip, lines) if line and not line.startswith("#")]
+
+        # Each address is dominated by Geocoding + Solar API round-trips, so
+        # threads overlap the network waits (requests releases the GIL on I/O)
+        total = len(addresses)
+        workers = max(1, min(args.workers, total))
+        if workers > 1:
+            # Step-by-step progress from concurrent analyses would interleave
+            # into noise; keep only the per-address header, summary and saves
+            engine.verbose = False
+        base_paths = [os.path.join(args.output_dir, name) for name in _batch_report_names(addresses)]
+        print(f"\n[BATCH] Processing {total} addresses ({workers} workers)...")
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_process_batch_address, engine, args, i + 1, total, addr, base_path)
+                for i, (addr, base_path) in enumerate(zip(addresses, base_paths))
+            ]
+            for future in futures:
+                future.result()
 
         print(f"\n[BATCH] Done. Reports saved to: {args.output_dir}/")
         return
@@ -0,0 +1,525 @@
+"""
+test_roofing_analysis_engine.py — Pytest test cases for roofing_analysis_engine.py
+==================================================================================
+Run with:  pytest tools/test_roofing_analysis_engine.py -v
+
+No network access: the Google API calls are stubbed out where needed.
+"""
+
+import json
+import math
+import os
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+import roofing_analysis_engine as rae
+from roofing_analysis_engine import ResponseCache, RoofingAnalysisEngine
+
+
+# ─────────────────────────────────────────────────────────
+#  Helpers
+# ─────────────────────────────────────────────────────────
+
+def _solar_payload(segment_count=4):
+    """Minimal buildingInsights response with a mix of pitches and aspects."""
+    segments = [
+        {
+            "pitchDegrees": 18.43 + 5 * (i % 3),
+            "azimuthDegrees": (90 * i + 10) % 360,
+            "stats": {"areaMeters2": 40.0 + 7 * i},
+            "planeHeightAtCenterMeters": 5.5,
+        }
+        for i in range(segment_count)
+    ]
+    return {
+        "solarPotential": {
+            "roofSegmentStats": segments,
+            "maxSunshineHoursPerYear": 1500.0,
+            "maxArrayPanelsCount": 24,
+            "solarPanelConfigs": [{"yearlyEnergyDcKwh": 5200.0}],
+        },
+        "imageryQuality": "HIGH",
+        "imageryDate": {"year": 2025, "month": 6, "day": 14},
+    }
+
+
+@pytest.fixture
+def engine():
+    # A placeholder session: every test stubs out the functions that use it
+    return RoofingAnalysisEngine(api_key="AIza" + "k" * 35, session=object(), verbose=False)
+
+
+@pytest.fixture
+def report(engine, monkeypatch):
+    monkeypatch.setattr(rae, "call_solar_api", lambda lat, lng, api_key, session=None: _solar_payload(6))
+    return engine.analyze(lat=53.5461, lng=-113.4938)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# GEOMETRY HELPERS
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class TestDegreesToCardinal:
+    """Sectors are half-open: a heading exactly on a boundary goes clockwise."""
+
+    @pytest.mark.parametrize("deg, expected", [
+        (0, "N"),
+        (11.2, "N"),
+        (11.25, "NNE"),
+        (22.5, "NNE"),
+        (56.25, "ENE"),
+        (90, "E"),
+        (180, "S"),
+        (348.74, "NNW"),
+        (348.75, "N"),
+        (360, "N"),
+        (-10, "N"),
+        (-90, "W"),
+        (725, "N"),
+    ])
+    def test_heading(self, deg, expected):
+        assert rae.degrees_to_cardinal(deg) == expected
+
+
+class TestPitchToRatio:
+    """X:12 strings come from a table on the 0.1 deg grid."""
+
+    @staticmethod
+    def _tan_formula(degrees):
+        return f"{round(12 * math.tan(math.radians(degrees)) * 10) / 10}:12"
+
+    def test_grid_matches_tan_formula(self):
+        for tenths in range(1, 900):
+            assert rae.pitch_to_ratio(tenths / 10) == self._tan_formula(tenths / 10), tenths / 10
+
+    def test_common_pitches(self):
+        assert rae.pitch_to_ratio(18.4) == "4.0:12"
+        assert rae.pitch_to_ratio(26.6) == "6.0:12"
+        assert rae.pitch_to_ratio(45.0) == "12.0:12"
+
+    def test_off_grid_uses_nearest_tenth(self):
+        # The raw formula would give 0.7:12; 3.564 deg reports as 3.6 deg
+        assert self._tan_formula(3.564) == "0.7:12"
+        assert rae.pitch_to_ratio(3.564) == rae.pitch_to_ratio(3.6) == "0.8:12"
+        assert rae.pitch_to_ratio(26.56) == rae.pitch_to_ratio(26.6)
+
+    @pytest.mark.parametrize("degrees", [0, -5, 89.95, 90, 95.5])
+    def test_flat_vertical_and_out_of_range(self, degrees):
+        assert rae.pitch_to_ratio(degrees) == "0:12"
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# MATERIAL ESTIMATE
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class TestMaterialEstimate:
+    """2000 sq ft, two 6:12 facets; edge totals are supplied directly."""
+
+    ALWAYS = ["shingles", "underlayment", "nails"]
+
+    @staticmethod
+    def _estimate(**edge_totals):
+        segment = rae.RoofSegment(name="S1", footprint_area_sqft=1789, true_area_sqft=1000, true_area_sqm=92.9,
+                                  pitch_degrees=26.6, pitch_ratio="6.0:12", azimuth_degrees=180.0,
+                                  azimuth_direction="S")
+        summary = rae.EdgeSummary(total_linear_ft=sum(edge_totals.values()), **edge_totals)
+        return rae.compute_material_estimate(2000, [], [segment, segment], edge_summary=summary)
+
+    def test_no_ridge_or_valley_rows(self):
+        est = self._estimate(total_eave_ft=100.0, total_rake_ft=60.0)
+        assert [i.category for i in est.line_items] == [
+            "shingles", "underlayment", "ice_shield", "starter_strip", "drip_edge", "nails",
+        ]
+        # Same total as when the zero-length rows were still listed at $0
+        assert est.total_material_cost_cad == 3863.0
+        assert est.total_material_cost_cad == round(sum(i.line_total_cad for i in est.line_items), 2)
+
+    def test_no_edges_lists_only_fixed_rows(self):
+        est = self._estimate()
+        assert [i.category for i in est.line_items] == self.ALWAYS
+
+    def test_all_edges_list_every_row(self):
+        est = self._estimate(total_ridge_ft=40.0, total_hip_ft=20.0, total_valley_ft=15.0,
+                             total_eave_ft=100.0, total_rake_ft=60.0)
+        assert [i.category for i in est.line_items] == [
+            "shingles", "underlayment", "ice_shield", "starter_strip", "ridge_cap",
+            "drip_edge", "valley_metal", "nails", "ventilation",
+        ]
+        for item in est.line_items:
+            assert item.line_total_cad == round(item.order_quantity * item.unit_price_cad, 2)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# API RESPONSE CACHE
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class TestResponseCache:
+    """Run against both JSON backends (orjson when installed, stdlib)."""
+
+    @pytest.fixture(autouse=True, params=["default", "stdlib"])
+    def setup(self, request, tmp_path, monkeypatch):
+        if request.param == "stdlib":
+            monkeypatch.setattr(rae, "orjson", None)
+        self.dir = tmp_path / "cache"
+        self.cache = ResponseCache(str(self.dir), ttl_seconds=60)
+
+    def test_miss(self):
+        assert self.cache.get(("solar", 53.5, -113.4)) is None
+
+    def test_hit(self):
+        value = {"solarPotential": {"roofSegmentStats": [{"pitchDegrees": 26.57}]}}
+        self.cache.set(("solar", 53.5, -113.4), value)
+        assert self.cache.get(("solar", 53.5, -113.4)) == value
+        assert self.cache.get(("solar", 53.5, -113.5)) is None
+
+    def test_expiry(self):
+        key = ("geocode", "123 MAIN ST")
+        self.cache.set(key, [53.5, -113.4])
+        path = self.cache._path(key)
+        old = time.time() - 120
+        os.utime(path, (old, old))
+        assert self.cache.get(key) is None
+
+    def test_disabled(self):
+        self.cache.enabled = False
+        self.cache.set(("geocode", "X"), [1.0, 2.0])
+        assert self.cache.get(("geocode", "X")) is None
+        assert not self.dir.exists()
+
+    def test_failed_write_leaves_no_temp_file(self, monkeypatch):
+        def fail(*args):
+            raise OSError("disk full")
+        monkeypatch.setattr(rae.os, "replace", fail)
+        self.cache.set(("geocode", "X"), [1.0, 2.0])
+        assert list(self.dir.iterdir()) == []
+        assert self.cache.get(("geocode", "X")) is None
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# GEOCODING
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class _FakeResponse:
+    def __init__(self, payload):
+        self.status_code = 200
+        self.content = json.dumps(payload).encode("utf-8")
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class _FakeSession:
+    """Records each GET and answers with a fixed Geocoding payload."""
+
+    def __init__(self, payload):
+        self.payload = payload
+        self.urls = []
+
+    def get(self, url, timeout=None):
+        self.urls.append(url)
+        return _FakeResponse(self.payload)
+
+
+class TestGeocodeAddress:
+    OK = {"status": "OK", "results": [{"geometry": {"location": {"lat": 53.5461, "lng": -113.4938}}}]}
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path, monkeypatch):
+        self.cache_dir = tmp_path / "cache"
+        monkeypatch.setattr(rae, "_API_CACHE", ResponseCache(str(self.cache_dir), ttl_seconds=60))
+        monkeypatch.setattr(rae, "_GEOCODE_MEMO", {})
+
+    def test_normalized_addresses_share_one_lookup(self):
+        session = _FakeSession(self.OK)
+        assert rae.geocode_address("123 main st", "KEY", session=session) == (53.5461, -113.4938)
+        assert rae.geocode_address(" 123  MAIN ST ", "KEY", session=session) == (53.5461, -113.4938)
+        assert len(session.urls) == 1
+
+    def test_memo_answers_without_disk_cache(self):
+        session = _FakeSession(self.OK)
+        rae.geocode_address("123 main st", "KEY", session=session)
+        for path in self.cache_dir.iterdir():
+            path.unlink()
+        assert rae.geocode_address("123 MAIN ST", "KEY", session=session) == (53.5461, -113.4938)
+        assert len(session.urls) == 1
+        assert rae._GEOCODE_MEMO == {"123 MAIN ST": (53.5461, -113.4938)}
+
+    def test_no_cache_bypasses_memo(self):
+        rae._API_CACHE.enabled = False
+        session = _FakeSession(self.OK)
+        rae.geocode_address("123 main st", "KEY", session=session)
+        rae.geocode_address("123 main st", "KEY", session=session)
+        assert len(session.urls) == 2
+        assert rae._GEOCODE_MEMO == {}
+
+    def test_failed_lookup_is_not_memoized(self):
+        session = _FakeSession({"status": "ZERO_RESULTS", "results": []})
+        assert rae.geocode_address("1 Nowhere Rd", "KEY", session=session) is None
+        assert rae.geocode_address("1 Nowhere Rd", "KEY", session=session) is None
+        assert len(session.urls) == 2
+        assert rae._GEOCODE_MEMO == {}
+        assert not self.cache_dir.exists()
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# ANALYSIS PIPELINE
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class TestAnalyzeProgress:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch):
+        monkeypatch.setattr(rae, "call_solar_api", lambda lat, lng, api_key, session=None: _solar_payload())
+
+    def test_quiet_engine_prints_nothing(self, engine, capsys):
+        engine.analyze(lat=53.5461, lng=-113.4938)
+        assert capsys.readouterr().out == ""
+
+    def test_verbose_engine_prints_every_step(self, capsys):
+        engine = RoofingAnalysisEngine(api_key="AIza" + "k" * 35, session=object(), verbose=True)
+        engine.analyze(lat=53.5461, lng=-113.4938)
+        out = capsys.readouterr().out
+        positions = [out.find(f"[{step}/10]") for step in range(1, 11)]
+        assert -1 not in positions
+        assert positions == sorted(positions)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# CONCURRENT ANALYSIS
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class TestAnalyzeMany:
+    """Geocoding + Solar are stubbed; address i geocodes to latitude 50 + i."""
+
+    ADDRESSES = [f"{100 + i} Main St, Edmonton, AB" for i in range(6)]
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch):
+        def fake_geocode(address, api_key, session=None):
+            if address.startswith("BAD"):
+                return None
+            return 50.0 + self.ADDRESSES.index(address), -113.5
+
+        def fake_solar(lat, lng, api_key, session=None):
+            if lat == 53.0:
+                raise RuntimeError("Solar API error 404")
+            # Earlier addresses finish last, so completion order != input order
+            time.sleep((60 - lat) * 0.005)
+            return _solar_payload()
+
+        monkeypatch.setattr(rae, "geocode_address", fake_geocode)
+        monkeypatch.setattr(rae, "call_solar_api", fake_solar)
+
+    def test_empty(self, engine):
+        assert engine.analyze_many([]) == []
+
+    def test_preserves_input_order(self, engine):
+        addresses = [a for i, a in enumerate(self.ADDRESSES) if i != 3]
+        reports = engine.analyze_many(addresses, max_concurrency=4)
+        assert [r.address for r in reports] == addresses
+        assert [r.latitude for r in reports] == [50.0, 51.0, 52.0, 54.0, 55.0]
+
+    def test_shingle_type_applies_to_all(self, engine):
+        reports = engine.analyze_many(self.ADDRESSES[:2], shingle_type="3-tab")
+        assert all(r.materials.shingle_type == "3-tab" for r in reports)
+
+    def test_reraises_first_failure(self, engine):
+        # Index 1 fails geocoding, index 3 fails the Solar call; input order wins
+        addresses = [self.ADDRESSES[0], "BAD address", self.ADDRESSES[2], self.ADDRESSES[3]]
+        with pytest.raises(RuntimeError, match="Failed to geocode address: BAD address"):
+            engine.analyze_many(addresses, max_concurrency=4)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# HTML REPORT
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class TestHtmlReport:
+
+    def test_iter_matches_generate(self, engine, report):
+        pieces = list(engine.iter_html_report(report))
+        assert len(pieces) > 3
+        assert "".join(pieces) == engine.generate_html_report(report)
+
+    def test_one_piece_per_facet(self, engine, report):
+        facets = [p for p in engine.iter_html_report(report) if p.startswith('<div class="p3-facet">')]
+        assert len(facets) == len(report.segments)
+
+    def test_document_bounds(self, engine, report):
+        html = engine.generate_html_report(report)
+        assert html.startswith("<!DOCTYPE html>")
+        assert html.endswith("</html>")
+
+    def test_address_is_escaped(self, engine, report):
+        report.address = "<b>12 Rue de l'Église</b>"
+        html = engine.generate_html_report(report)
+        assert "<b>12" not in html
+        assert "&lt;b&gt;12 Rue de l&#x27;Église&lt;/b&gt;" in html
+
+    def test_dated_from_generated_at(self, engine, report):
+        report.generated_at = "2024-02-29T23:30:00Z"
+        html = engine.generate_html_report(report)
+        assert f"RM-20240229-{report.order_id:04d}" in html
+        assert "February 29, 2024" in html
+
+    @pytest.mark.parametrize("stamp", ["", "not a date", "2024-13-45T00:00:00Z"])
+    def test_bad_generated_at_falls_back_to_now(self, engine, report, stamp):
+        report.generated_at = stamp
+        before = datetime.now(timezone.utc)
+        html = engine.generate_html_report(report)
+        after = datetime.now(timezone.utc)
+        assert any(f"RM-{day:%Y%m%d}-" in html and f"{day:%B %d, %Y}" in html for day in (before, after))
+
+    def test_save_writes_same_document(self, engine, report, tmp_path):
+        path = tmp_path / "report.html"
+        engine.save_html_report(report, str(path))
+        assert path.read_text(encoding="utf-8") == engine.generate_html_report(report)
+
+    def test_render_error_keeps_existing_file(self, engine, report, tmp_path):
+        path = tmp_path / "report.html"
+        path.write_text("previous report", encoding="utf-8")
+        report.materials = None
+        with pytest.raises(AttributeError):
+            engine.save_html_report(report, str(path))
+        assert path.read_text(encoding="utf-8") == "previous report"
+
+    def test_error_mid_render_leaves_no_partial_file(self, engine, report, tmp_path):
+        path = tmp_path / "report.html"
+        report.segments.append(None)  # fails at its facet row, after pieces were written
+        with pytest.raises(AttributeError):
+            engine.save_html_report(report, str(path))
+        assert not path.exists()
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# CLI BATCH MODE
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class TestBatchCli:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path, monkeypatch):
+        def fake_geocode(address, api_key, session=None):
+            return None if address.startswith("BAD") else (53.5461, -113.4938)
+
+        monkeypatch.setattr(rae, "geocode_address", fake_geocode)
+        monkeypatch.setattr(rae, "call_solar_api", lambda lat, lng, api_key, session=None: _solar_payload())
+        self.batch_file = tmp_path / "addresses.txt"
+        self.batch_file.write_text("# comment\n\n1 Main St, Edmonton\n  # indented comment\n2 Oak Ave, Edmonton\n",
+                                   encoding="utf-8")
+        self.tmp_path = tmp_path
+        self.out_dir = tmp_path / "out"
+        self.monkeypatch = monkeypatch
+
+    def _run(self, *extra, out_dir=None, quiet=True):
+        out_dir = out_dir or self.out_dir
+        self.monkeypatch.setattr(rae.sys, "argv", [
+            "roofing_analysis_engine.py", "--batch", str(self.batch_file), "--api-key", "AIza" + "k" * 35,
+            "--output-dir", str(out_dir), *(["--quiet"] if quiet else []), *extra,
+        ])
+        rae.main()
+        return sorted(p.name for p in out_dir.iterdir())
+
+    @staticmethod
+    def _contents(out_dir):
+        """File name -> content, minus the per-run timestamp fields of the JSON."""
+        files = {}
+        for path in out_dir.iterdir():
+            text = path.read_text(encoding="utf-8")
+            if path.suffix == ".json":
+                data = json.loads(text)
+                del data["generated_at"], data["api_duration_ms"]
+                text = data
+            files[path.name] = text
+        return files
+
+    def test_writes_html_and_json(self):
+        assert self._run() == ["1_Main_St__Edmonton.html", "1_Main_St__Edmonton.json",
+                               "2_Oak_Ave__Edmonton.html", "2_Oak_Ave__Edmonton.json"]
+
+    def test_no_html_writes_json_only(self):
+        assert self._run("--no-html") == ["1_Main_St__Edmonton.json", "2_Oak_Ave__Edmonton.json"]
+
+    def test_serial_and_concurrent_runs_write_the_same_files(self, capsys):
+        # "1 Main St; Edmonton" sanitizes to the same name as "1 Main St, Edmonton"
+        addresses = ["1 Main St, Edmonton", "1 Main St; Edmonton", "2 Oak Ave, Edmonton",
+                     "3 Elm Rd, Calgary", "4 Pine Cres, Red Deer", "5 Birch Way, Leduc"]
+        self.batch_file.write_text("\n".join(addresses) + "\n", encoding="utf-8")
+        serial = self._run("--workers", "1", out_dir=self.tmp_path / "serial", quiet=False)
+        concurrent = self._run("--workers", "4", out_dir=self.tmp_path / "concurrent", quiet=False)
+        assert serial == concurrent
+        assert len(serial) == 2 * len(addresses)
+        assert "1_Main_St__Edmonton_2.json" in serial
+        assert self._contents(self.tmp_path / "serial") == self._contents(self.tmp_path / "concurrent")
+
+    def test_concurrent_run_skips_step_progress(self, capsys):
+        self._run("--workers", "1", out_dir=self.tmp_path / "serial", quiet=False)
+        assert "[1/10]" in capsys.readouterr().out
+        self._run("--workers", "2", out_dir=self.tmp_path / "concurrent", quiet=False)
+        out = capsys.readouterr().out
+        assert "[1/10]" not in out
+        assert out.count("REUSE CANADA - PRO-GRADE ROOF MEASUREMENT REPORT") == 2
+
+    def test_error_names_the_address(self, capsys):
+        self.batch_file.write_text("1 Main St, Edmonton\nBAD 2 Oak Ave\n", encoding="utf-8")
+        assert self._run("--workers", "2") == ["1_Main_St__Edmonton.html", "1_Main_St__Edmonton.json"]
+        assert "  ERROR [2/2] BAD 2 Oak Ave: Failed to geocode address: BAD 2 Oak Ave" in capsys.readouterr().out
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# CONSOLE SUMMARY
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class TestSummary:
+
+    def test_print_summary_writes_format_summary(self, engine, report, capsys):
+        engine.print_summary(report)
+        assert capsys.readouterr().out == engine.format_summary(report)
+
+    def test_layout(self, engine, report):
+        text = engine.format_summary(report)
+        lines = text.split("\n")
+        assert lines[:4] == [
+            "",
+            "=" * 60,
+            "  REUSE CANADA - PRO-GRADE ROOF MEASUREMENT REPORT v3.0",
+            "=" * 60,
+        ]
+        assert lines[4] == f"  Property:   {report.address}"
+        assert lines[5] == f"  Coords:     ({report.latitude}, {report.longitude})"
+        assert text.endswith("=" * 60 + "\n")
+        assert "\n  AREA MEASUREMENTS\n" in text
+        assert "\n  SOLAR POTENTIAL\n" in text
+
+    def test_quality_notes(self, engine, report):
+        report.quality_notes = ["Imagery older than 3 years"]
+        assert "\n  NOTE: Imagery older than 3 years\n" in engine.format_summary(report)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# JSON OUTPUT
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class TestJsonOutput:
+    """Same document from orjson (when installed) and the stdlib fallback."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, report):
+        report.address = "12 Rue de l'Église, Québec, QC"
+
+    def test_backends_match(self, engine, report, monkeypatch):
+        fast = engine.to_json(report)
+        monkeypatch.setattr(rae, "orjson", None)
+        assert engine.to_json(report) == fast
+        assert "Église" in fast
+
+    @pytest.mark.parametrize("backend", ["default", "stdlib"])
+    def test_save_json_matches_to_json(self, engine, report, tmp_path, monkeypatch, backend):
+        if backend == "stdlib":
+            monkeypatch.setattr(rae, "orjson", None)
+        path = tmp_path / "report.json"
+        engine.save_json(report, str(path))
+        assert path.read_bytes() == engine.to_json(report).encode("utf-8")
+        assert json.loads(path.read_bytes())["address"] == report.address